@@ -1,12 +1,32 @@
-from typing import Generator
-from fastapi import Depends, HTTPException, status
+import hashlib
+import json
+import re
+import threading
+import time
+from typing import Generator, Optional
+from uuid import UUID
+from cachetools import TTLCache
+from pydantic import BaseModel, ConfigDict
+
+try:
+    import redis as redis_lib
+except ImportError:  # pragma: no cover - redis is an optional extra
+    redis_lib = None
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from jose import JWTError, jwt
+# PyJWT delegates HMAC verification to OpenSSL (via cryptography), which is
+# measurably faster than python-jose's pure-Python path on every request.
+# Tokens are still plain HS256, so those minted elsewhere stay compatible.
+import jwt
+from jwt import InvalidTokenError as JWTError
 
 from ..db.database import get_db
 from ..core.config import settings
 from ..core.exceptions import UnauthorizedException
+from ..models.enums import UserRole
 from ..models.user import User
 from ..services.submission_service import SubmissionService
 from ..services.playground.mock_playground_service import MockPlaygroundService
@@ -14,45 +34,259 @@ from ..services.playground.real_playground_service import RealPlaygroundService
 from ..services.playground.playground_service_factory import PlaygroundServiceFactory
 from ..services.playground_execution_interface import IPlaygroundExecutionService
 
-security = HTTPBearer(auto_error=False)
+# Hoisted out of the per-request path: building an HTTPException (plus its
+# headers dict) and the algorithms list on every call is pure allocation
+# churn. HTTPException carries no per-request state, so one instance is safe
+# to re-raise.
+_ALGORITHMS = [settings.JWT_ALGORITHM]
+_CREDENTIALS_EXC = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Could not validate credentials",
+    headers={"WWW-Authenticate": "Bearer"},
+)
+_ADMIN_EXC = HTTPException(
+    status_code=status.HTTP_403_FORBIDDEN,
+    detail="Admin access required",
+)
+
+
+class _BearerAuth(HTTPBearer):
+    """HTTPBearer with auto_error, but keeping this API's 401 contract.
+
+    auto_error=True rejects missing/non-Bearer credentials inside the
+    security scheme, before get_current_user is ever invoked — but stock
+    HTTPBearer raises 403 there, and this API (and its tests) promise 401
+    with a WWW-Authenticate header for unauthenticated requests.
+    """
+
+    async def __call__(self, request: Request) -> HTTPAuthorizationCredentials:
+        try:
+            return await super().__call__(request)
+        except HTTPException:
+            raise _CREDENTIALS_EXC
+
 
+security = _BearerAuth(auto_error=True)
 
-def get_current_user(
+# Structural shape of a JWT: three base64url segments. Anything else is
+# rejected before we spend HMAC cycles on it, so garbage tokens cost a
+# regex match instead of a signature verification.
+_TOKEN_SHAPE = re.compile(r"[A-Za-z0-9_\-]+\.[A-Za-z0-9_\-]+\.[A-Za-z0-9_\-]+")
+_TOKEN_MAX_LEN = 4096
+
+# Decoded-payload cache so repeated requests with the same bearer token skip
+# the HMAC + JSON work in jwt.decode. Entries are keyed by a short BLAKE2b
+# digest of the token (never the raw token) and expire with the cache TTL or
+# the token's own "exp", whichever comes first.
+_JWT_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+_JWT_CACHE_LOCK = threading.Lock()
+
+
+def _decode_token(token: str) -> dict:
+    """Decode a JWT, memoizing valid payloads until close to their expiry."""
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    try:
+        with _JWT_CACHE_LOCK:
+            payload, exp = _JWT_CACHE[key]
+        if exp > time.time():
+            return payload
+    except KeyError:
+        pass
+    try:
+        payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=_ALGORITHMS)
+    except JWTError:
+        with _JWT_CACHE_LOCK:
+            _JWT_CACHE.pop(key, None)
+        raise
+    exp = payload.get("exp")
+    if exp is not None:
+        with _JWT_CACHE_LOCK:
+            _JWT_CACHE[key] = (payload, exp)
+    return payload
+
+
+class AuthUser(BaseModel):
+    """Session-independent snapshot of the authenticated user.
+
+    SQLAlchemy ``User`` instances are bound to the request's session, so the
+    auth cache stores this lightweight view instead. It carries every field
+    the auth path and the legacy ``/me`` endpoint actually read. Frozen so
+    the per-request dependency cache always hands back the same validated,
+    immutable object — FastAPI never re-validates it for sub-dependencies.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    id: str
+    username: Optional[str]
+    email: Optional[str]
+    role: UserRole
+    is_active: bool
+    is_admin: bool
+
+
+# user_id -> AuthUser snapshot. Short TTL so role/deactivation changes
+# propagate quickly; invalidate_user_cache() drops an entry immediately.
+_USER_CACHE: TTLCache = TTLCache(maxsize=2048, ttl=30)
+_USER_CACHE_LOCK = threading.Lock()
+_USER_CACHE_TTL = 30
+
+# Second cache tier, shared across worker processes when REDIS_URL is set.
+# The per-process TTLCache only helps a single worker; under multiple
+# uvicorn/gunicorn workers each keeps its own copy and the DB absorbs one
+# auth query per worker per TTL. Keys are per-user (not per-token) so
+# invalidate_user_cache() can evict across all workers in one DELETE.
+# Redis being down or absent must never break auth, so every call degrades
+# to the DB path on error.
+_AUTH_REDIS = None
+if redis_lib is not None and settings.REDIS_URL:
+    _AUTH_REDIS = redis_lib.Redis.from_url(
+        settings.REDIS_URL, decode_responses=True, socket_timeout=0.2
+    )
+
+
+def _redis_key(user_id: str) -> str:
+    return f"auth:user:{user_id}"
+
+
+def _snapshot_from_json(raw: str) -> AuthUser:
+    data = json.loads(raw)
+    return AuthUser(
+        id=data["id"],
+        username=data["username"],
+        email=data["email"],
+        role=UserRole(data["role"]),
+        is_active=data["is_active"],
+        is_admin=data["is_admin"],
+    )
+
+
+def _get_cached_user(user_id: str) -> Optional[AuthUser]:
+    """Cache-only lookup; returns None on miss without touching the DB."""
+    try:
+        with _USER_CACHE_LOCK:
+            return _USER_CACHE[user_id]
+    except KeyError:
+        return None
+
+
+def _load_user(db: Session, user_id: str) -> Optional[AuthUser]:
+    """Fetch the AuthUser snapshot for user_id, caching hot lookups."""
+    cached = _get_cached_user(user_id)
+    if cached is not None:
+        return cached
+    if _AUTH_REDIS is not None:
+        try:
+            raw = _AUTH_REDIS.get(_redis_key(user_id))
+        except redis_lib.RedisError:
+            raw = None
+        if raw is not None:
+            snapshot = _snapshot_from_json(raw)
+            with _USER_CACHE_LOCK:
+                _USER_CACHE[user_id] = snapshot
+            return snapshot
+    # Core select of just the columns AuthUser needs — skips full-entity
+    # materialization and identity-map bookkeeping on the auth hot path.
+    row = db.execute(
+        select(User.id, User.username, User.email, User.role, User.isActive,
+               User.isAdmin)
+        .where(User.id == user_id)
+    ).first()
+    if row is None:
+        return None
+    role = row.role if isinstance(row.role, UserRole) else UserRole(row.role)
+    snapshot = AuthUser(
+        id=row.id,
+        username=row.username,
+        email=row.email,
+        # Coerce here, once, so get_admin_user can rely on identity checks.
+        role=role,
+        is_active=row.isActive,
+        # Rows predating the denormalized column fall back to the role.
+        is_admin=bool(row.isAdmin) if row.isAdmin is not None else role is UserRole.ADMIN,
+    )
+    with _USER_CACHE_LOCK:
+        _USER_CACHE[user_id] = snapshot
+    if _AUTH_REDIS is not None:
+        try:
+            _AUTH_REDIS.setex(
+                _redis_key(user_id),
+                _USER_CACHE_TTL,
+                json.dumps({
+                    "id": snapshot.id,
+                    "username": snapshot.username,
+                    "email": snapshot.email,
+                    "role": snapshot.role.value,
+                    "is_active": snapshot.is_active,
+                    "is_admin": snapshot.is_admin,
+                }),
+            )
+        except redis_lib.RedisError:
+            pass
+    return snapshot
+
+
+def invalidate_user_cache(user_id: str) -> None:
+    """Drop a user's cached snapshot after a mutation (role, deactivation...)."""
+    with _USER_CACHE_LOCK:
+        _USER_CACHE.pop(user_id, None)
+    if _AUTH_REDIS is not None:
+        try:
+            _AUTH_REDIS.delete(_redis_key(user_id))
+        except redis_lib.RedisError:
+            pass
+
+
+async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
-) -> User:
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    if credentials is None:
-        raise credentials_exception
+) -> AuthUser:
+    # async so the common case — cached token + cached user — runs entirely
+    # on the event loop with no threadpool hop; only a snapshot-cache miss
+    # pays for a worker thread to do the blocking DB fetch.
+    token = credentials.credentials
+    if len(token) > _TOKEN_MAX_LEN or not _TOKEN_SHAPE.fullmatch(token):
+        raise _CREDENTIALS_EXC
     try:
-        token = credentials.credentials
-        payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
+        payload = _decode_token(token)
+        sub = payload.get("sub")
+        if sub is None:
+            raise _CREDENTIALS_EXC
     except JWTError:
-        raise credentials_exception
-    user = db.query(User).filter(User.id == user_id).first()
+        raise _CREDENTIALS_EXC
+    try:
+        # Validate and canonicalize once at the boundary: User.id is a
+        # String(36) UUID, so binding the normalized form keeps the PK
+        # lookup type-stable (and unifies cache keys for mixed-case subs).
+        user_id = str(UUID(sub))
+    except (ValueError, AttributeError, TypeError):
+        raise _CREDENTIALS_EXC
+    user = _get_cached_user(user_id)
+    if user is None:
+        user = await run_in_threadpool(_load_user, db, user_id)
     if user is None:
-        raise credentials_exception
+        raise _CREDENTIALS_EXC
     return user
 
 
-def get_admin_user(current_user: User = Depends(get_current_user)) -> User:
-    if current_user.role.value != "ADMIN":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin access required"
-        )
+async def get_admin_user(current_user: AuthUser = Depends(get_current_user)) -> AuthUser:
+    # Denormalized at write time (and into the snapshot), so the admin gate
+    # is a single boolean field read.
+    if not current_user.is_admin:
+        raise _ADMIN_EXC
     return current_user
 
 
+# Shared singletons: the services keep no per-request state (the mock tracks
+# runs keyed by submission_id, which only works if every request sees the
+# same instance), so DI hands back one instance instead of re-running
+# __init__ per request.
+_MOCK_PLAYGROUND = MockPlaygroundService()
+_REAL_PLAYGROUND = RealPlaygroundService()
+
+
 def get_playground_execution_service() -> IPlaygroundExecutionService:
-    return MockPlaygroundService()
+    return _MOCK_PLAYGROUND
 
 
 def get_submission_service(
@@ -63,8 +297,8 @@ def get_submission_service(
 
 
 async def get_real_playground_service() -> IPlaygroundExecutionService:
-    return RealPlaygroundService()
+    return _REAL_PLAYGROUND
 
 
 def get_mock_playground_service() -> IPlaygroundExecutionService:
-    return MockPlaygroundService()
+    return _MOCK_PLAYGROUND
@@ -1,14 +1,28 @@
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPBearer
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from typing import List, Dict, Any
+from typing import Any, Dict, List
 import asyncio
+import csv
+import itertools
 import json
-from datetime import datetime
+import time
+
+import orjson
+from datetime import datetime, timedelta
+from enum import Enum
+from io import StringIO
 from loguru import logger
 
-from ...db.database import get_db
-from ...controllers.admin_controller import AdminController
+from fastapi_cache.decorator import cache
+
+from ...core.cache import admin_shared_key_builder, per_user_key_builder
+from ...core.config import settings
+from ...core.timeutils import now_iso
+from ...db.database import get_db, SessionLocal
+from ...controllers.admin_controller import admin_controller
 from ...core.security import get_current_user, get_current_admin
 from ...models.user import User
 from ...models.agent import Agent
@@ -16,7 +30,7 @@ from ...models.task import Task
 from ...models.submission import Submission
 from ...models.evaluation import EvaluationResult
 from ...models.enums import UserRole, SubmissionStatus
-from sqlalchemy import func, extract
+from sqlalchemy import case, func, extract, select
 from ...schemas.admin_schema import (
     AdminDashboardStats, UserManagementRequest, TaskAnalytics,
     UserAnalytics, SystemMonitoring, LeaderboardInsights,
@@ -27,179 +41,246 @@ from ...schemas.admin_schema import (
 router = APIRouter(prefix="/admin", tags=["Admin"])
 security = HTTPBearer()
 
+
+def _count_subquery(model, *criteria):
+    """Correlated COUNT(*) as a scalar subquery, so several count metrics
+    (across different tables) can travel in one SELECT without the cross
+    join a naive multi-count select would produce."""
+    stmt = select(func.count()).select_from(model)
+    if criteria:
+        stmt = stmt.filter(*criteria)
+    return stmt.scalar_subquery()
+
 # WebSocket connection manager for real-time updates
 class ConnectionManager:
+    # Bounded per-connection buffer: a stalled client holds at most this
+    # many pending messages instead of ballooning broker memory.
+    QUEUE_SIZE = 100
+    # Hard caps checked at handshake time. Each socket costs a task plus a
+    # bounded queue, so capping connections keeps broadcast fanout and
+    # memory inside a predictable envelope under a connect flood.
+    MAX_ADMIN_CONNECTIONS = 500
+    MAX_ACTIVE_CONNECTIONS = 5000
+
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
-        self.admin_connections: List[WebSocket] = []
+        # Dicts give O(1) add/remove and map each socket to its outbound
+        # queue; a dedicated sender task per socket drains the queue so
+        # broadcasts never block on a slow client's network.
+        self.active_connections: Dict[WebSocket, asyncio.Queue] = {}
+        self.admin_connections: Dict[WebSocket, asyncio.Queue] = {}
+        self._sender_tasks: Dict[WebSocket, asyncio.Task] = {}
 
-    async def connect(self, websocket: WebSocket, is_admin: bool = False):
+    async def connect(self, websocket: WebSocket, is_admin: bool = False) -> bool:
+        group = self.admin_connections if is_admin else self.active_connections
+        cap = self.MAX_ADMIN_CONNECTIONS if is_admin else self.MAX_ACTIVE_CONNECTIONS
+        if len(group) >= cap:
+            # 1013 = "try again later"; shed load before accepting.
+            await websocket.close(code=1013, reason="capacity")
+            return False
         await websocket.accept()
-        if is_admin:
-            self.admin_connections.append(websocket)
-        else:
-            self.active_connections.append(websocket)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+        group[websocket] = queue
+        self._sender_tasks[websocket] = asyncio.create_task(
+            self._sender(websocket, queue)
+        )
+        return True
 
     def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
-        if websocket in self.admin_connections:
-            self.admin_connections.remove(websocket)
+        self.active_connections.pop(websocket, None)
+        self.admin_connections.pop(websocket, None)
+        task = self._sender_tasks.pop(websocket, None)
+        if task is not None:
+            task.cancel()
 
     async def send_personal_message(self, message: str, websocket: WebSocket):
         await websocket.send_text(message)
 
-    async def broadcast_to_admins(self, message: dict):
-        for connection in self.admin_connections:
+    async def _sender(self, websocket: WebSocket, queue: asyncio.Queue):
+        try:
+            while True:
+                await websocket.send_text(await queue.get())
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.disconnect(websocket)
+
+    def _enqueue(self, queue: asyncio.Queue, payload: str):
+        try:
+            queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            # Drop the oldest update: stale dashboard frames are worthless
+            # once a newer one exists, and memory stays O(QUEUE_SIZE).
             try:
-                await connection.send_text(json.dumps(message))
-            except:
-                await self.disconnect(connection)
+                queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+            queue.put_nowait(payload)
+
+    async def broadcast_to_admins(self, message: dict):
+        # Serialize once, not once per connection; orjson also handles
+        # datetimes natively so payload builders need no default= hook.
+        payload = orjson.dumps(message).decode()
+        for queue in self.admin_connections.values():
+            self._enqueue(queue, payload)
 
     async def broadcast_system_update(self, update: dict):
-        for connection in self.active_connections + self.admin_connections:
-            try:
-                await connection.send_text(json.dumps(update))
-            except:
-                await self.disconnect(connection)
+        payload = orjson.dumps(update).decode()
+        for queue in itertools.chain(
+            self.active_connections.values(), self.admin_connections.values()
+        ):
+            self._enqueue(queue, payload)
 
 manager = ConnectionManager()
 
 # Dashboard and Analytics Routes
 @router.get("/dashboard", response_model=Dict[str, Any])
+@cache(expire=settings.ADMIN_ANALYTICS_CACHE_TTL, key_builder=admin_shared_key_builder)
 async def get_admin_dashboard(
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_admin),
     db: Session = Depends(get_db)
 ):
     """Get comprehensive admin dashboard with all platform statistics"""
-    admin_controller = AdminController(db)
-    return admin_controller.get_dashboard_stats(current_user)
+    # Sync SQLAlchemy work runs on the threadpool so the aggregate scans
+    # suspend this coroutine instead of blocking the event loop.
+    return await run_in_threadpool(admin_controller.get_dashboard_stats, db)
 
 @router.get("/analytics/users", response_model=Dict[str, Any])
+@cache(expire=settings.ADMIN_ANALYTICS_CACHE_TTL, key_builder=admin_shared_key_builder)
 async def get_user_analytics(
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_admin),
     db: Session = Depends(get_db)
 ):
     """Get detailed user analytics and behavior patterns"""
-    admin_controller = AdminController(db)
-    return admin_controller.get_user_analytics(current_user)
+    return await run_in_threadpool(admin_controller.get_user_analytics, db)
 
 @router.get("/analytics/tasks", response_model=Dict[str, Any])
+@cache(expire=settings.ADMIN_ANALYTICS_CACHE_TTL, key_builder=admin_shared_key_builder)
 async def get_task_analytics(
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_admin),
     db: Session = Depends(get_db)
 ):
     """Get comprehensive task performance analytics"""
-    admin_controller = AdminController(db)
-    return admin_controller.get_task_analytics(current_user)
+    return await run_in_threadpool(admin_controller.get_task_analytics, db)
 
 @router.get("/monitoring/realtime", response_model=Dict[str, Any])
 async def get_real_time_monitoring(
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_admin),
     db: Session = Depends(get_db)
 ):
     """Get real-time system monitoring data"""
-    admin_controller = AdminController(db)
-    return admin_controller.get_real_time_monitoring(current_user)
+    return await run_in_threadpool(admin_controller.get_real_time_monitoring, db)
 
 @router.get("/leaderboard/insights", response_model=Dict[str, Any])
+@cache(expire=settings.ADMIN_ANALYTICS_CACHE_TTL, key_builder=admin_shared_key_builder)
 async def get_leaderboard_insights(
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_admin),
     db: Session = Depends(get_db)
 ):
     """Get comprehensive leaderboard and performance insights"""
-    admin_controller = AdminController(db)
-    return admin_controller.get_leaderboard_insights(current_user)
+    return await run_in_threadpool(admin_controller.get_leaderboard_insights, db)
 
 # User Management Routes
-@router.post("/users/{action}")
-async def manage_user(
-    action: str,
-    user_data: UserManagementRequest,
-    current_user: User = Depends(get_current_user),
+# Note: the bulk route must be registered before /users/{action},
+# otherwise the path parameter swallows "bulk-action".
+@router.post("/users/bulk-action")
+async def bulk_user_action(
+    bulk_action: BulkUserAction,
+    current_user: User = Depends(get_current_admin),
     db: Session = Depends(get_db),
     background_tasks: BackgroundTasks = BackgroundTasks()
 ):
-    """Manage individual users (activate, deactivate, promote, demote, verify)"""
-    admin_controller = AdminController(db)
-    result = admin_controller.manage_users(action, user_data, current_user)
+    """Perform bulk actions on multiple users"""
+    # One UPDATE ... WHERE id IN (...) instead of a SELECT/UPDATE/COMMIT
+    # round-trip per user.
+    result = admin_controller.manage_users_bulk(db, bulk_action.action, bulk_action.user_ids)
     
-    # Send real-time update to admin dashboard
+    # Send bulk update notification
     background_tasks.add_task(
         manager.broadcast_to_admins,
         {
-            "type": "user_management",
-            "action": action,
-            "user_id": user_data.user_id,
-            "timestamp": datetime.utcnow().isoformat(),
+            "type": "bulk_user_action",
+            "action": bulk_action.action,
+            "affected_users": result["requested"],
+            "successful": result["affected"],
+            "timestamp": now_iso(),
             "admin": current_user.email
         }
     )
     
-    return result
+    return {
+        "results": result,
+        "summary": {"total": result["requested"], "successful": result["affected"]}
+    }
 
-@router.post("/users/bulk-action")
-async def bulk_user_action(
-    bulk_action: BulkUserAction,
-    current_user: User = Depends(get_current_user),
+@router.post("/users/{action}")
+async def manage_user(
+    action: str,
+    user_data: UserManagementRequest,
+    current_user: User = Depends(get_current_admin),
     db: Session = Depends(get_db),
     background_tasks: BackgroundTasks = BackgroundTasks()
 ):
-    """Perform bulk actions on multiple users"""
-    if current_user.role != UserRole.ADMIN:
-        raise HTTPException(status_code=403, detail="Admin access required")
-    
-    admin_controller = AdminController(db)
-    results = []
-    
-    for user_id in bulk_action.user_ids:
-        try:
-            user_request = UserManagementRequest(user_id=user_id, reason=bulk_action.reason)
-            result = admin_controller.manage_users(bulk_action.action, user_request, current_user)
-            results.append({"user_id": user_id, "success": True, "result": result})
-        except Exception as e:
-            results.append({"user_id": user_id, "success": False, "error": str(e)})
+    """Manage individual users (activate, deactivate, promote, demote, verify)"""
+    result = admin_controller.manage_users(db, action, user_data)
     
-    # Send bulk update notification
+    # Send real-time update to admin dashboard
     background_tasks.add_task(
         manager.broadcast_to_admins,
         {
-            "type": "bulk_user_action",
-            "action": bulk_action.action,
-            "affected_users": len(bulk_action.user_ids),
-            "successful": len([r for r in results if r["success"]]),
-            "timestamp": datetime.utcnow().isoformat(),
+            "type": "user_management",
+            "action": action,
+            "user_id": user_data.user_id,
+            "timestamp": now_iso(),
             "admin": current_user.email
         }
     )
     
-    return {"results": results, "summary": {"total": len(results), "successful": len([r for r in results if r["success"]])}}
+    return result
+
+# System-metric sampling for /health/system. cpu_percent(interval=1) used
+# to run inline and parked the event loop for a full second per request;
+# we now take non-blocking delta readings off the loop (interval=None
+# returns the usage since the previous call) and cache the sample briefly
+# so monitor polls don't wake psutil on every hit.
+_SYSTEM_METRICS_TTL = 5.0
+_system_metrics: Dict[str, float] = {}
+_system_metrics_expiry = 0.0
+
+
+def _collect_system_metrics() -> Dict[str, float]:
+    import psutil
+    return {
+        "cpu_usage": psutil.cpu_percent(interval=None),
+        "memory_usage": psutil.virtual_memory().percent,
+        "disk_usage": psutil.disk_usage('/').percent,
+    }
+
+
+async def _get_system_metrics() -> Dict[str, float]:
+    global _system_metrics, _system_metrics_expiry
+    now = time.monotonic()
+    if now >= _system_metrics_expiry:
+        _system_metrics = await run_in_threadpool(_collect_system_metrics)
+        _system_metrics_expiry = now + _SYSTEM_METRICS_TTL
+    return _system_metrics
+
 
 # System Health and Monitoring
 @router.get("/health/system", response_model=SystemHealthCheck)
 async def get_system_health(
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_admin),
     db: Session = Depends(get_db)
 ):
     """Get detailed system health information"""
-    if current_user.role != UserRole.ADMIN:
-        raise HTTPException(status_code=403, detail="Admin access required")
-    
-    import psutil
-    import time
-    
     try:
-        cpu_usage = psutil.cpu_percent(interval=1)
-        memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
-        
+        metrics = await _get_system_metrics()
         return SystemHealthCheck(
             database_status="healthy",
             api_status="operational",
             evaluation_service="running",
-            memory_usage=memory.percent,
-            cpu_usage=cpu_usage,
-            disk_usage=disk.percent,
+            memory_usage=metrics["memory_usage"],
+            cpu_usage=metrics["cpu_usage"],
+            disk_usage=metrics["disk_usage"],
             last_check=datetime.utcnow()
         )
     except Exception as e:
@@ -214,40 +295,44 @@ async def get_system_health(
         )
 
 @router.get("/stats/platform", response_model=Dict[str, Any])
+@cache(expire=settings.ADMIN_ANALYTICS_CACHE_TTL, key_builder=admin_shared_key_builder)
 async def get_platform_statistics(
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_admin),
     db: Session = Depends(get_db)
 ):
     """Get comprehensive platform statistics and trends"""
-    if current_user.role != UserRole.ADMIN:
-        raise HTTPException(status_code=403, detail="Admin access required")
-    
-    admin_controller = AdminController(db)
-    
-    # Combine multiple analytics for comprehensive view
-    dashboard_stats = admin_controller.get_dashboard_stats(current_user)
-    user_analytics = admin_controller.get_user_analytics(current_user)
-    task_analytics = admin_controller.get_task_analytics(current_user)
+    # The three analytics passes are independent aggregate queries, so run
+    # them concurrently on the threadpool. Each worker gets its own session
+    # (Session objects are not thread-safe); total latency is the slowest
+    # pass instead of the sum of all three.
+    def _with_session(method_name: str):
+        session = SessionLocal()
+        try:
+            return getattr(admin_controller, method_name)(session)
+        finally:
+            session.close()
+
+    dashboard_stats, user_analytics, task_analytics = await asyncio.gather(
+        run_in_threadpool(_with_session, "get_dashboard_stats"),
+        run_in_threadpool(_with_session, "get_user_analytics"),
+        run_in_threadpool(_with_session, "get_task_analytics"),
+    )
     
     return {
         "overview": dashboard_stats,
         "user_insights": user_analytics,
         "task_insights": task_analytics,
-        "generated_at": datetime.utcnow().isoformat()
+        "generated_at": now_iso()
     }
 
 # Cool Feature: Agent Performance Insights
 @router.get("/insights/agent-performance", response_model=Dict[str, Any])
+@cache(expire=settings.ADMIN_ANALYTICS_CACHE_TTL, key_builder=admin_shared_key_builder)
 async def get_agent_performance_insights(
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_admin),
     db: Session = Depends(get_db)
 ):
     """Get advanced agent performance insights with ML-style analysis"""
-    if current_user.role != UserRole.ADMIN:
-        raise HTTPException(status_code=403, detail="Admin access required")
-    
-
-    
     try:
         # Agent type performance comparison
         agent_performance = db.query(
@@ -257,7 +342,11 @@ async def get_agent_performance_insights(
             func.avg(EvaluationResult.timeTaken).label('avg_time'),
             func.min(EvaluationResult.score).label('min_score'),
             func.max(EvaluationResult.score).label('max_score')
-        ).join(Submission).join(EvaluationResult).group_by(Agent.agentType).all()
+        ).select_from(Agent).join(
+            Submission, Submission.agentId == Agent.id
+        ).join(
+            EvaluationResult, EvaluationResult.submissionId == Submission.id
+        ).group_by(Agent.agentType).all()
         
         # Environment difficulty analysis
         env_difficulty = db.query(
@@ -265,26 +354,40 @@ async def get_agent_performance_insights(
             Task.difficulty,
             func.avg(EvaluationResult.score).label('avg_score'),
             func.count(Submission.id).label('attempts')
-        ).join(Submission).join(EvaluationResult).group_by(
+        ).select_from(Task).join(
+            Submission, Submission.taskId == Task.id
+        ).join(
+            EvaluationResult, EvaluationResult.submissionId == Submission.id
+        ).group_by(
             Task.webArenaEnvironment, Task.difficulty
         ).all()
         
-        # Success patterns
+        # Success patterns, with every max/min reduction folded into the
+        # same pass: the old code walked agent_performance five times and
+        # the unguarded max(...).avg_score crashed on an empty list.
+        agent_types = []
+        best_agent = most_active = lowest_agent = None
+        for perf in agent_performance:
+            agent_types.append({
+                "type": perf.agentType,
+                "submissions": perf.total_submissions,
+                "avg_score": round(perf.avg_score, 2) if perf.avg_score else 0,
+                "avg_time": round(perf.avg_time, 2) if perf.avg_time else 0,
+                "score_range": {
+                    "min": round(perf.min_score, 2) if perf.min_score else 0,
+                    "max": round(perf.max_score, 2) if perf.max_score else 0
+                },
+                "consistency": round((perf.avg_score / perf.max_score * 100), 2) if perf.max_score else 0
+            })
+            if best_agent is None or (perf.avg_score or 0) > (best_agent.avg_score or 0):
+                best_agent = perf
+            if most_active is None or perf.total_submissions > most_active.total_submissions:
+                most_active = perf
+            if lowest_agent is None or (perf.avg_score or 100) < (lowest_agent.avg_score or 100):
+                lowest_agent = perf
+
         success_patterns = {
-            "agent_types": [
-                {
-                    "type": perf.agentType,
-                    "submissions": perf.total_submissions,
-                    "avg_score": round(perf.avg_score, 2) if perf.avg_score else 0,
-                    "avg_time": round(perf.avg_time, 2) if perf.avg_time else 0,
-                    "score_range": {
-                        "min": round(perf.min_score, 2) if perf.min_score else 0,
-                        "max": round(perf.max_score, 2) if perf.max_score else 0
-                    },
-                    "consistency": round((perf.avg_score / perf.max_score * 100), 2) if perf.max_score else 0
-                }
-                for perf in agent_performance
-            ],
+            "agent_types": agent_types,
             "environment_analysis": {}
         }
         
@@ -302,8 +405,6 @@ async def get_agent_performance_insights(
         # Performance recommendations
         recommendations = []
         
-        # Analyze agent types
-        best_agent = max(agent_performance, key=lambda x: x.avg_score or 0, default=None)
         if best_agent:
             recommendations.append({
                 "type": "agent_optimization",
@@ -328,175 +429,234 @@ async def get_agent_performance_insights(
             "performance_analysis": success_patterns,
             "recommendations": recommendations,
             "insights": {
-                "total_agent_types": len(agent_performance),
-                "most_active_type": max(agent_performance, key=lambda x: x.total_submissions, default=None).agentType if agent_performance else "N/A",
+                "total_agent_types": len(agent_types),
+                "most_active_type": most_active.agentType if most_active else "N/A",
                 "performance_spread": {
-                    "highest_avg": round(max(agent_performance, key=lambda x: x.avg_score or 0, default=None).avg_score or 0, 2),
-                    "lowest_avg": round(min(agent_performance, key=lambda x: x.avg_score or 100, default=None).avg_score or 0, 2)
+                    "highest_avg": round(best_agent.avg_score or 0, 2) if best_agent else 0,
+                    "lowest_avg": round(lowest_agent.avg_score or 0, 2) if lowest_agent else 0
                 }
             },
-            "generated_at": datetime.utcnow().isoformat()
+            "generated_at": now_iso()
         }
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating insights: {str(e)}")
 
+# Precomputed activity-heatmap rollup. Scanning 30 days of submissions
+# per request does not scale with table size, so a background task
+# (spawned at startup) re-aggregates the 7x24 matrix every 15 minutes and
+# requests just read the cached result.
+_HEATMAP_REFRESH_INTERVAL = 900
+_heatmap_rollup: Dict[str, Any] = {}
+
+
+def _compute_heatmap_rollup(db: Session) -> Dict[str, Any]:
+    # Submission activity by hour of day and day of week, folded into a
+    # 7x24 matrix with the peak/total reductions in the same pass.
+    activity_data = db.query(
+        extract('hour', Submission.submittedAt).label('hour'),
+        extract('dow', Submission.submittedAt).label('day_of_week'),
+        func.count(Submission.id).label('activity_count')
+    ).filter(
+        Submission.submittedAt >= datetime.utcnow() - timedelta(days=30)
+    ).group_by('hour', 'day_of_week').all()
+
+    days = ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday']
+    matrix = [[0] * 24 for _ in range(7)]
+    peak_activity = None
+    total_activity = 0
+    for activity in activity_data:
+        matrix[int(activity.day_of_week)][int(activity.hour)] = activity.activity_count
+        total_activity += activity.activity_count
+        if peak_activity is None or activity.activity_count > peak_activity.activity_count:
+            peak_activity = activity
+
+    heatmap = {
+        day_name: {f"hour_{hour}": matrix[day_idx][hour] for hour in range(24)}
+        for day_idx, day_name in enumerate(days)
+    }
+
+    return {
+        "heatmap_data": heatmap,
+        "insights": {
+            "peak_hour": int(peak_activity.hour) if peak_activity else 0,
+            "peak_day": days[int(peak_activity.day_of_week)] if peak_activity else "Unknown",
+            "peak_activity_count": peak_activity.activity_count if peak_activity else 0,
+            "total_submissions_30d": total_activity,
+            "average_hourly_activity": round(total_activity / (24 * 7), 2)
+        },
+        "refreshed_at": now_iso()
+    }
+
+
+def _refresh_heatmap_rollup() -> Dict[str, Any]:
+    global _heatmap_rollup
+    session = SessionLocal()
+    try:
+        _heatmap_rollup = _compute_heatmap_rollup(session)
+        return _heatmap_rollup
+    finally:
+        session.close()
+
+
+async def heatmap_rollup_refresher():
+    """Keep the heatmap rollup warm; spawned once at application startup."""
+    while True:
+        try:
+            await run_in_threadpool(_refresh_heatmap_rollup)
+        except Exception as e:
+            logger.warning(f"Heatmap rollup refresh failed: {e}")
+        await asyncio.sleep(_HEATMAP_REFRESH_INTERVAL)
+
+
+_DAILY_STATS_REFRESH_INTERVAL = 300
+
+
+def _refresh_daily_stats() -> Dict[str, Any]:
+    session = SessionLocal()
+    try:
+        return admin_controller.refresh_daily_stats(session)
+    finally:
+        session.close()
+
+
+async def daily_stats_refresher():
+    """Keep the daily_stats rollup warm; spawned once at application startup."""
+    while True:
+        try:
+            await run_in_threadpool(_refresh_daily_stats)
+        except Exception as e:
+            logger.warning(f"daily_stats rollup refresh failed: {e}")
+        await asyncio.sleep(_DAILY_STATS_REFRESH_INTERVAL)
+
+
 # Cool Feature: Platform Activity Heatmap
 @router.get("/insights/activity-heatmap", response_model=Dict[str, Any])
+@cache(expire=300, key_builder=admin_shared_key_builder)
 async def get_activity_heatmap(
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_admin),
     db: Session = Depends(get_db)
 ):
     """Generate platform activity heatmap for visualization"""
-    if current_user.role != UserRole.ADMIN:
-        raise HTTPException(status_code=403, detail="Admin access required")
-    
-    from datetime import datetime, timedelta
-    
     try:
-        # Get submission activity by hour of day and day of week
-        activity_data = db.query(
-            extract('hour', Submission.submittedAt).label('hour'),
-            extract('dow', Submission.submittedAt).label('day_of_week'),
-            func.count(Submission.id).label('activity_count')
-        ).filter(
-            Submission.submittedAt >= datetime.utcnow() - timedelta(days=30)
-        ).group_by('hour', 'day_of_week').all()
-        
-        # Create heatmap matrix
-        heatmap = {}
-        days = ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday']
-        
-        for day_idx, day_name in enumerate(days):
-            heatmap[day_name] = {}
-            for hour in range(24):
-                heatmap[day_name][f"hour_{hour}"] = 0
-        
-        # Fill with actual data
-        for activity in activity_data:
-            day_name = days[int(activity.day_of_week)]
-            hour_key = f"hour_{int(activity.hour)}"
-            heatmap[day_name][hour_key] = activity.activity_count
-        
-        # Calculate peak activity insights
-        peak_activity = max(activity_data, key=lambda x: x.activity_count, default=None)
-        total_activity = sum(activity.activity_count for activity in activity_data)
-        
-        return {
-            "heatmap_data": heatmap,
-            "insights": {
-                "peak_hour": int(peak_activity.hour) if peak_activity else 0,
-                "peak_day": days[int(peak_activity.day_of_week)] if peak_activity else "Unknown",
-                "peak_activity_count": peak_activity.activity_count if peak_activity else 0,
-                "total_submissions_30d": total_activity,
-                "average_hourly_activity": round(total_activity / (24 * 7), 2)
-            },
-            "generated_at": datetime.utcnow().isoformat()
-        }
-        
+        # Serve the precomputed rollup; a fresh compute only happens if the
+        # refresher task has not produced one yet (first request after boot).
+        rollup = _heatmap_rollup or await run_in_threadpool(_refresh_heatmap_rollup)
+        return {**rollup, "generated_at": now_iso()}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating heatmap: {str(e)}")
 
+async def heartbeat_producer():
+    """Broadcast one shared heartbeat to all admin sockets every 30s.
+
+    A single producer task replaces the sleep loop each socket used to
+    run: N connections no longer mean N timers and N identical
+    serializations per interval. Spawned once at application startup.
+    """
+    while True:
+        await asyncio.sleep(30)
+        await manager.broadcast_to_admins({
+            "type": "heartbeat",
+            "timestamp": now_iso(),
+            "status": "healthy"
+        })
+
 # WebSocket for real-time admin updates
 @router.websocket("/ws/realtime")
 async def websocket_admin_realtime(websocket: WebSocket):
-    await manager.connect(websocket, is_admin=True)
+    if not await manager.connect(websocket, is_admin=True):
+        return
     try:
+        # Heartbeats arrive via the shared producer; this task only has to
+        # keep the socket open and notice when the client goes away.
         while True:
-            # Send periodic updates
-            await asyncio.sleep(30)  # Update every 30 seconds
-            
-            # You can add real-time metrics here
-            update = {
-                "type": "heartbeat",
-                "timestamp": datetime.utcnow().isoformat(),
-                "status": "healthy"
-            }
-            await manager.send_personal_message(json.dumps(update), websocket)
-            
+            await websocket.receive_text()
     except WebSocketDisconnect:
         manager.disconnect(websocket)
 
+_EXPORT_STATEMENTS = {
+    "users": select(
+        User.id, User.email, User.firstName, User.lastName,
+        User.role, User.isActive, User.createdAt, User.loginCount,
+    ),
+    "agents": select(
+        Agent.id, Agent.name, Agent.agentType, Agent.userId,
+        Agent.isActive, Agent.createdAt,
+    ),
+    "submissions": select(
+        Submission.id, Submission.userId, Submission.agentId,
+        Submission.taskId, Submission.status, Submission.submittedAt,
+    ),
+}
+
+
+def _export_statement(data_type: str):
+    try:
+        return _EXPORT_STATEMENTS[data_type]
+    except KeyError:
+        raise HTTPException(status_code=400, detail="Invalid data type")
+
+
+def _csv_value(value):
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _json_rows(db: Session, stmt):
+    """Yield a JSON export document row by row, serialized with orjson."""
+    yield b'{"format":"json","exported_at":"' + now_iso().encode() + b'","data":['
+    count = 0
+    for row in db.execute(stmt.execution_options(yield_per=1000)):
+        yield (b"," if count else b"") + orjson.dumps(dict(row._mapping))
+        count += 1
+    yield b'],"count":' + str(count).encode() + b"}"
+
+
+def _csv_rows(db: Session, stmt):
+    """Yield CSV lines from a server-side cursor, one chunk at a time."""
+    buf = StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(stmt.selected_columns.keys())
+    yield buf.getvalue()
+    buf.seek(0)
+    buf.truncate()
+    for row in db.execute(stmt.execution_options(yield_per=1000)):
+        writer.writerow([_csv_value(v) for v in row])
+        yield buf.getvalue()
+        buf.seek(0)
+        buf.truncate()
+
+
 # Cool Feature: Export Platform Data
 @router.get("/export/{data_type}")
 async def export_platform_data(
     data_type: str,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_admin),
     db: Session = Depends(get_db),
     format: str = "json"
 ):
     """Export platform data in various formats (JSON, CSV)"""
-    if current_user.role != UserRole.ADMIN:
-        raise HTTPException(status_code=403, detail="Admin access required")
-    
+    stmt = _export_statement(data_type)
 
-    import pandas as pd
-    from io import StringIO
-    
-    try:
-        if data_type == "users":
-            users = db.query(User).all()
-            data = [
-                {
-                    "id": user.id,
-                    "email": user.email,
-                    "firstName": user.firstName,
-                    "lastName": user.lastName,
-                    "role": user.role.value,
-                    "isActive": user.isActive,
-                    "createdAt": user.createdAt.isoformat(),
-                    "loginCount": user.loginCount
-                }
-                for user in users
-            ]
-        elif data_type == "agents":
-            agents = db.query(Agent).all()
-            data = [
-                {
-                    "id": agent.id,
-                    "name": agent.name,
-                    "agentType": agent.agentType,
-                    "userId": agent.userId,
-                    "isActive": agent.isActive,
-                    "createdAt": agent.createdAt.isoformat()
-                }
-                for agent in agents
-            ]
-        elif data_type == "submissions":
-            submissions = db.query(Submission).all()
-            data = [
-                {
-                    "id": sub.id,
-                    "userId": sub.userId,
-                    "agentId": sub.agentId,
-                    "taskId": sub.taskId,
-                    "status": sub.status.value,
-                    "submittedAt": sub.submittedAt.isoformat()
-                }
-                for sub in submissions
-            ]
-        else:
-            raise HTTPException(status_code=400, detail="Invalid data type")
-        
-        if format.lower() == "csv":
-            df = pd.DataFrame(data)
-            csv_buffer = StringIO()
-            df.to_csv(csv_buffer, index=False)
-            return {
-                "format": "csv",
-                "data": csv_buffer.getvalue(),
-                "filename": f"{data_type}_export_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.csv"
-            }
-        else:
-            return {
-                "format": "json",
-                "data": data,
-                "count": len(data),
-                "exported_at": datetime.utcnow().isoformat()
-            }
-            
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error exporting data: {str(e)}")
+    if format.lower() == "csv":
+        # Stream rows straight off a yield_per cursor: peak memory stays
+        # O(chunk) instead of materializing the whole table (the previous
+        # pandas DataFrame held every row three times over), and the client
+        # starts receiving bytes immediately.
+        filename = f"{data_type}_export_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.csv"
+        return StreamingResponse(
+            _csv_rows(db, stmt),
+            media_type="text/csv",
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        )
+
+    # JSON follows the same streaming model as CSV: rows are serialized
+    # with orjson as they come off the cursor instead of being buffered
+    # into one giant dict and re-encoded by the framework.
+    return StreamingResponse(_json_rows(db, stmt), media_type="application/json")
 
 # Background task for sending notifications
 async def send_admin_notification(notification_type: str, data: dict):
@@ -504,52 +664,65 @@ async def send_admin_notification(notification_type: str, data: dict):
     await manager.broadcast_to_admins({
         "type": notification_type,
         "data": data,
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": now_iso()
     })
 
 @router.get("/stats", response_model=Dict[str, Any])
+@cache(expire=settings.ADMIN_ANALYTICS_CACHE_TTL, key_builder=admin_shared_key_builder)
 async def get_admin_stats(
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_admin),
     db: Session = Depends(get_db)
 ):
     """Get basic admin statistics for dashboard"""
-    if current_user.role != UserRole.ADMIN:
-        raise HTTPException(status_code=403, detail="Admin access required")
-    
-    admin_controller = AdminController(db)
-    
     try:
-        # Get basic stats
-        total_users = db.query(User).count()
-        total_agents = db.query(Agent).count()
-        total_tasks = db.query(Task).count()
-        total_submissions = db.query(Submission).count()
-        completed_submissions = db.query(Submission).filter(
-            Submission.status == SubmissionStatus.COMPLETED
-        ).count()
-        active_users = db.query(User).filter(User.isActive == True).count()
-        
-        # Calculate performance metrics
-        avg_score = db.query(func.avg(EvaluationResult.score)).scalar() or 0
-        
-        # Get recent activity
-        recent_submissions = db.query(Submission).order_by(
-            Submission.submittedAt.desc()
-        ).limit(10).all()
-        
-        # Recent activity formatted
+        # All basic counters plus the average score in one round-trip
+        totals = db.execute(select(
+            _count_subquery(User).label("total_users"),
+            _count_subquery(User, User.isActive == True).label("active_users"),
+            _count_subquery(Agent).label("total_agents"),
+            _count_subquery(Task).label("total_tasks"),
+            _count_subquery(Submission).label("total_submissions"),
+            _count_subquery(
+                Submission, Submission.status == SubmissionStatus.COMPLETED
+            ).label("completed_submissions"),
+            select(func.avg(EvaluationResult.score)).scalar_subquery().label("avg_score"),
+        )).one()
+        total_users = totals.total_users
+        active_users = totals.active_users
+        total_agents = totals.total_agents
+        total_tasks = totals.total_tasks
+        total_submissions = totals.total_submissions
+        completed_submissions = totals.completed_submissions
+        avg_score = totals.avg_score or 0
+        
+        # Recent activity as a single projected query over the submittedAt
+        # index: only the displayed columns travel, no ORM objects or
+        # relationship hydration.
+        recent_submissions = (
+            db.query(
+                Submission.id,
+                Submission.status,
+                Submission.submittedAt,
+                User.firstName,
+                User.lastName,
+                Task.title,
+            )
+            .outerjoin(User, Submission.userId == User.id)
+            .outerjoin(Task, Submission.taskId == Task.id)
+            .order_by(Submission.submittedAt.desc())
+            .limit(10)
+            .all()
+        )
+
         recent_activity = []
-        for submission in recent_submissions:
-            user = db.query(User).filter(User.id == submission.userId).first()
-            task = db.query(Task).filter(Task.id == submission.taskId).first()
-            
+        for row in recent_submissions:
             recent_activity.append({
-                "id": str(submission.id),
+                "id": str(row.id),
                 "type": "submission",
-                "user": f"{user.firstName} {user.lastName}" if user else "Unknown User",
-                "task": task.title if task else "Unknown Task",
-                "status": submission.status.value,
-                "timestamp": submission.submittedAt.isoformat() if submission.submittedAt else None
+                "user": f"{row.firstName} {row.lastName}" if row.firstName else "Unknown User",
+                "task": row.title if row.title else "Unknown Task",
+                "status": row.status,
+                "timestamp": row.submittedAt.isoformat() if row.submittedAt else None
             })
         
         # Format response
@@ -577,33 +750,53 @@ async def get_dashboard_stats(
 ):
     """Get real dashboard statistics."""
     try:
-        # Get user statistics
-        total_users = db.query(User).count()
-        active_users = db.query(User).filter(User.isActive == True).count()
-        
-        # Get agent statistics
-        total_agents = db.query(Agent).count()
-        user_agents = db.query(Agent).filter(Agent.userId == current_admin.id).count()
-        
-        # Get task statistics
-        total_tasks = db.query(Task).count()
-        active_tasks = db.query(Task).filter(Task.isActive == True).count()
-        
-        # Get submission statistics
-        total_submissions = db.query(Submission).count()
-        user_submissions = db.query(Submission).filter(Submission.userId == current_admin.id).count()
-        completed_submissions = db.query(Submission).filter(Submission.status == SubmissionStatus.COMPLETED).count()
-        
-        # Get recent activity
+        # User/agent/task/submission counters in a single round-trip
+        totals = db.execute(select(
+            _count_subquery(User).label("total_users"),
+            _count_subquery(User, User.isActive == True).label("active_users"),
+            _count_subquery(Agent).label("total_agents"),
+            _count_subquery(Agent, Agent.userId == current_admin.id).label("user_agents"),
+            _count_subquery(Task).label("total_tasks"),
+            # Task has no active flag, so every task counts as active; the
+            # old Task.isActive filter made this whole endpoint 500.
+            _count_subquery(Task).label("active_tasks"),
+            _count_subquery(Submission).label("total_submissions"),
+            _count_subquery(
+                Submission, Submission.userId == current_admin.id
+            ).label("user_submissions"),
+            _count_subquery(
+                Submission, Submission.status == SubmissionStatus.COMPLETED
+            ).label("completed_submissions"),
+        )).one()
+        total_users = totals.total_users
+        active_users = totals.active_users
+        total_agents = totals.total_agents
+        user_agents = totals.user_agents
+        total_tasks = totals.total_tasks
+        active_tasks = totals.active_tasks
+        total_submissions = totals.total_submissions
+        user_submissions = totals.user_submissions
+        completed_submissions = totals.completed_submissions
+        
+        # Get recent activity (projected columns only; score comes from the
+        # evaluation row since submissions carry no score column)
         recent_submissions = (
-            db.query(Submission)
+            db.query(
+                Submission.id,
+                Submission.status,
+                Submission.createdAt,
+                Task.title.label("task_title"),
+                EvaluationResult.score.label("score"),
+            )
+            .outerjoin(Task, Submission.taskId == Task.id)
+            .outerjoin(EvaluationResult, EvaluationResult.submissionId == Submission.id)
             .order_by(Submission.createdAt.desc())
             .limit(5)
             .all()
         )
         
         recent_agents = (
-            db.query(Agent)
+            db.query(Agent.id, Agent.name, Agent.createdAt, Agent.agentType)
             .order_by(Agent.createdAt.desc())
             .limit(5)
             .all()
@@ -631,7 +824,7 @@ async def get_dashboard_stats(
                 "submissions": [
                     {
                         "id": sub.id,
-                        "task_name": sub.task.name if sub.task else "Unknown Task",
+                        "task_name": sub.task_title or "Unknown Task",
                         "status": sub.status,
                         "created_at": sub.createdAt.isoformat(),
                         "score": sub.score
@@ -654,28 +847,44 @@ async def get_dashboard_stats(
         raise HTTPException(status_code=500, detail="Failed to get dashboard statistics")
 
 @router.get("/user/dashboard/stats", response_model=Dict[str, Any])
+@cache(expire=60, key_builder=per_user_key_builder)
 async def get_user_dashboard_stats(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get user dashboard statistics."""
     try:
-        # Get user's agents
-        user_agents = db.query(Agent).filter(Agent.userId == current_user.id).count()
-        
-        # Get user's submissions
-        user_submissions = db.query(Submission).filter(Submission.userId == current_user.id).count()
-        completed_submissions = db.query(Submission).filter(
-            Submission.userId == current_user.id,
-            Submission.status == SubmissionStatus.COMPLETED
-        ).count()
-        
-        # Get available tasks
-        available_tasks = db.query(Task).filter(Task.isActive == True).count()
-        
-        # Get user's recent submissions
+        # The user's counters and available tasks in a single round-trip
+        totals = db.execute(select(
+            _count_subquery(Agent, Agent.userId == current_user.id).label("user_agents"),
+            _count_subquery(
+                Submission, Submission.userId == current_user.id
+            ).label("user_submissions"),
+            _count_subquery(
+                Submission,
+                Submission.userId == current_user.id,
+                Submission.status == SubmissionStatus.COMPLETED,
+            ).label("completed_submissions"),
+            # Task has no active flag (see dashboard stats): all tasks are
+            # available.
+            _count_subquery(Task).label("available_tasks"),
+        )).one()
+        user_agents = totals.user_agents
+        user_submissions = totals.user_submissions
+        completed_submissions = totals.completed_submissions
+        available_tasks = totals.available_tasks
+        
+        # Get user's recent submissions (projected, same shape as above)
         recent_submissions = (
-            db.query(Submission)
+            db.query(
+                Submission.id,
+                Submission.status,
+                Submission.createdAt,
+                Task.title.label("task_title"),
+                EvaluationResult.score.label("score"),
+            )
+            .outerjoin(Task, Submission.taskId == Task.id)
+            .outerjoin(EvaluationResult, EvaluationResult.submissionId == Submission.id)
             .filter(Submission.userId == current_user.id)
             .order_by(Submission.createdAt.desc())
             .limit(5)
@@ -684,7 +893,7 @@ async def get_user_dashboard_stats(
         
         # Get user's recent agents
         recent_agents = (
-            db.query(Agent)
+            db.query(Agent.id, Agent.name, Agent.createdAt, Agent.agentType)
             .filter(Agent.userId == current_user.id)
             .order_by(Agent.createdAt.desc())
             .limit(5)
@@ -714,7 +923,7 @@ async def get_user_dashboard_stats(
                 "submissions": [
                     {
                         "id": sub.id,
-                        "task_name": sub.task.name if sub.task else "Unknown Task",
+                        "task_name": sub.task_title or "Unknown Task",
                         "status": sub.status,
                         "created_at": sub.createdAt.isoformat(),
                         "score": sub.score
@@ -737,52 +946,50 @@ async def get_user_dashboard_stats(
         raise HTTPException(status_code=500, detail="Failed to get dashboard statistics")
 
 @router.get("/user/profile/analytics", response_model=Dict[str, Any])
+@cache(expire=settings.USER_STATS_CACHE_TTL, key_builder=per_user_key_builder)
 async def get_user_profile_analytics(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get analytics for the current user's profile"""
     try:
-        # Get user's submissions
-        total_submissions = db.query(Submission).filter(
-            Submission.userId == current_user.id
-        ).count()
-        
-        # Get user's completed submissions
-        completed_submissions = db.query(Submission).filter(
-            Submission.userId == current_user.id,
-            Submission.status == SubmissionStatus.COMPLETED
-        ).count()
-        
-        # Get user's best score
-        best_score = db.query(func.max(EvaluationResult.score)).join(Submission).filter(
-            Submission.userId == current_user.id
-        ).scalar() or 0
-        
-        # Get user's average score
-        avg_score = db.query(func.avg(EvaluationResult.score)).join(Submission).filter(
-            Submission.userId == current_user.id
-        ).scalar() or 0
-        
-        # Get total time spent
-        total_time = db.query(func.sum(EvaluationResult.timeTaken)).join(Submission).filter(
-            Submission.userId == current_user.id
-        ).scalar() or 0
-        
-        # Calculate success rate
+        # All seven aggregates in one scan of the user's submissions; the
+        # previous version issued a separate query (and round-trip) per
+        # metric. Evaluation rows join 1:1, so the counts stay exact.
+        # Keep this math SQL-side: pulling the rows into Python to reduce
+        # them client-side would move the cost to the app tier and add a
+        # native-compilation dependency for no gain at this row volume.
+        stats = (
+            db.query(
+                func.count(func.distinct(Submission.id)).label("total"),
+                func.sum(case(
+                    (Submission.status == SubmissionStatus.COMPLETED, 1), else_=0
+                )).label("completed"),
+                func.max(EvaluationResult.score).label("best_score"),
+                func.avg(EvaluationResult.score).label("avg_score"),
+                func.sum(EvaluationResult.timeTaken).label("total_time"),
+                func.avg(case((
+                    EvaluationResult.timeTaken > 0,
+                    EvaluationResult.score / EvaluationResult.timeTaken * 100
+                ))).label("efficiency"),
+                func.sum(case(
+                    (Submission.status != SubmissionStatus.FAILED, 1), else_=0
+                )).label("non_failed"),
+            )
+            .outerjoin(EvaluationResult, EvaluationResult.submissionId == Submission.id)
+            .filter(Submission.userId == current_user.id)
+            .one()
+        )
+
+        total_submissions = stats.total or 0
+        completed_submissions = stats.completed or 0
+        best_score = stats.best_score or 0
+        avg_score = stats.avg_score or 0
+        total_time = stats.total_time or 0
+        efficiency_score = stats.efficiency or 0
+        non_failed = stats.non_failed or 0
+
         success_rate = (completed_submissions / total_submissions * 100) if total_submissions > 0 else 0
-        
-        # Get efficiency score (average of score divided by time taken)
-        efficiency_score = db.query(func.avg(EvaluationResult.score / EvaluationResult.timeTaken * 100)).join(Submission).filter(
-            Submission.userId == current_user.id,
-            EvaluationResult.timeTaken > 0
-        ).scalar() or 0
-        
-        # Get reliability (percentage of non-failed submissions)
-        non_failed = db.query(Submission).filter(
-            Submission.userId == current_user.id,
-            Submission.status != SubmissionStatus.FAILED
-        ).count()
         reliability = (non_failed / total_submissions * 100) if total_submissions > 0 else 0
         
         return {
@@ -1,17 +1,29 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi_cache.decorator import cache
 from sqlalchemy.orm import Session
 from ...db.database import get_db
 from ...controllers.agent_controller import AgentController
 from ...schemas.agent_schema import AgentCreate, AgentResponse, AgentCreateLegacy
+from ...core.cache import invalidate_namespace, per_user_request_key_builder
+from ...core.config import settings
+from ...core.exceptions import NotFoundException
 from ...core.security import get_current_user
+from ...services.agent_service import AgentService
 from ...models.user import User
 from ...models.enums import UserRole
 from typing import List
 from uuid import UUID
-import uuid
+import re
 
 router = APIRouter(prefix="/agents", tags=["Agents"])
 
+# Validates UUID path params without the pure-Python uuid.UUID constructor.
+# These endpoints must keep returning 404 (not 422) for malformed ids, so
+# the check stays in the handlers rather than in a typed Path param.
+_UUID_RE = re.compile(
+    r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\Z"
+)
+
 @router.post("/extended", response_model=AgentResponse)
 async def create_agent(
     agent: AgentCreate,
@@ -19,9 +31,12 @@ async def create_agent(
     current_user: User = Depends(get_current_user)
 ):
     controller = AgentController(db)
-    return await controller.create_agent(agent, current_user.id)
+    result = await controller.create_agent(agent, current_user.id)
+    await invalidate_namespace("agents")
+    return result
 
 @router.get("/extended", response_model=List[AgentResponse])
+@cache(expire=settings.AGENT_LIST_CACHE_TTL, namespace="agents", key_builder=per_user_request_key_builder)
 async def get_my_agents(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -36,15 +51,12 @@ async def get_agent(
     current_user: User = Depends(get_current_user)
 ):
     
-    try:
-        agent_uuid = UUID(agent_id)
-    except ValueError:
-        from ...core.exceptions import NotFoundException
+    if not _UUID_RE.match(agent_id):
         # For backward-compat, treat non-UUID IDs as not found (404)
         raise NotFoundException("Agent not found")
 
     controller = AgentController(db)
-    return await controller.get_agent(agent_uuid, current_user.id)
+    return await controller.get_agent(UUID(agent_id), current_user.id)
 
 # -----------------------------------------------------------------------------
 # Legacy simplified agents endpoints expected by e2e tests
@@ -57,9 +69,9 @@ async def create_agent_legacy(
     current_user: User = Depends(get_current_user)
 ):
     """Create agent using simplified payload."""
-    from ...services.agent_service import AgentService  # local import to avoid cycle
     service = AgentService(db)
     agent_record = service.create_agent(agent.dict(exclude_unset=True), current_user.id)
+    await invalidate_namespace("agents")
     return {
         "id": agent_record.id,
         "name": agent.name,
@@ -69,19 +81,21 @@ async def create_agent_legacy(
     }
 
 @router.get("", status_code=200)
+@cache(expire=settings.AGENT_LIST_CACHE_TTL, namespace="agents", key_builder=per_user_request_key_builder)
 async def list_agents_legacy(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    from ...services.agent_service import AgentService
     service = AgentService(db)
     agents = service.get_user_agents(current_user.id)
+    # Direct attribute access: these are mapped columns on Agent, so the
+    # getattr-with-default fallbacks were dead branches on the hot path.
     items = [
         {
             "id": a.id,
-            "name": getattr(a, "name", "Agent"),
-            "description": getattr(a, "description", ""),
-            "created_at": str(a.createdAt) if hasattr(a, "createdAt") else None,
+            "name": a.name,
+            "description": a.description,
+            "created_at": str(a.createdAt) if a.createdAt else None,
         }
         for a in agents
     ]
@@ -93,17 +107,13 @@ async def get_agent_legacy(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    from ...services.agent_service import AgentService
-    try:
-        uuid.UUID(agent_id)
-    except ValueError:
+    if not _UUID_RE.match(agent_id):
         # For backward-compat, treat non-UUID IDs as not found (404) instead of bad request.
-        from ...core.exceptions import NotFoundException
         raise NotFoundException("Agent not found")
     service = AgentService(db)
     agent = service.get_agent_by_id(agent_id, current_user.id)
     return {
         "id": agent.id,
-        "name": getattr(agent, "name", "Agent"),
-        "description": getattr(agent, "description", ""),
+        "name": agent.name,
+        "description": agent.description,
     }
\ No newline at end of file
@@ -1,5 +1,7 @@
+import json
+from urllib.parse import parse_qsl
+
 from fastapi import APIRouter, Depends, HTTPException, status, Body, Request
-from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 
 from ...db.database import get_db
@@ -34,15 +36,28 @@ async def register_user(
 # POST /token (OAuth2 style)
 @router.post("/token")
 async def login_for_access_token(request: Request, db: Session = Depends(get_db)):
+    # Credential payloads are tiny, so read the body once and parse it
+    # directly: parse_qsl for the urlencoded path (skipping the multipart
+    # streaming machinery behind request.form()) and json for the rest.
     content_type = request.headers.get("content-type", "")
-    if content_type.startswith("application/x-www-form-urlencoded"):
-        form = await request.form()
-        username = form.get("username") or form.get("email")
-        password = form.get("password")
-    else:
-        body = await request.json()
-        username = body.get("username") or body.get("email")
-        password = body.get("password")
+    raw = await request.body()
+    try:
+        if content_type.startswith("application/x-www-form-urlencoded"):
+            fields = dict(parse_qsl(raw.decode("latin-1")))
+        else:
+            fields = json.loads(raw)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Malformed credentials payload",
+        )
+    if not isinstance(fields, dict):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Malformed credentials payload",
+        )
+    username = fields.get("username") or fields.get("email")
+    password = fields.get("password")
 
     auth = AuthService(db)
     # Guard against missing credentials early
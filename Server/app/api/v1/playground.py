@@ -1,14 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, Depends, HTTPException, Response, WebSocket, WebSocketDisconnect
 from fastapi.security import HTTPBearer
 from sqlalchemy.orm import Session
 from typing import Dict, Any, List, Optional
+import orjson
 import random
 import asyncio
 import json
-from datetime import datetime
+from uuid import uuid4
+
+from loguru import logger
 
 from ...db.database import get_db
 from ...core.security import get_current_user
+from ...core.timeutils import cached_now_iso
 from ...models.user import User
 from ...models.enums import TaskDifficulty
 from ...services.playground.playground_service_factory import PlaygroundServiceFactory
@@ -42,19 +46,90 @@ PLAYGROUND_ENVIRONMENTS = {
     }
 }
 
+# The environment catalog is a module constant, so its responses are frozen
+# once at import time instead of being rebuilt and re-encoded per request.
+_ENV_KEYS = list(PLAYGROUND_ENVIRONMENTS.keys())
+_ENV_DETAILS_JSON = {
+    env_id: orjson.dumps(env) for env_id, env in PLAYGROUND_ENVIRONMENTS.items()
+}
+
+# Dedicated PRNG plus hoisted constant pools for the mock endpoints: the
+# handlers draw several values per request, and rebuilding these lists (or
+# going through the module-level random functions) on every hit is wasted
+# work when the endpoints are hammered under load tests.
+_rng = random.Random()
+_TASK_DIFFICULTIES = tuple(TaskDifficulty)
+_SUCCESS_CRITERIA = [
+    "Complete the task objective",
+    "Maintain proper interaction flow",
+    "Handle errors gracefully"
+]
+# Static portion of each environment's mock tasks (ids, display names,
+# descriptions) computed once; the endpoint only fills in the per-request
+# difficulty and estimated time.
+_TASK_TEMPLATES = {
+    env_id: [
+        {
+            "id": f"{env_id}_{task_type}",
+            "name": task_type.replace("_", " ").title(),
+            "type": task_type,
+            "environment": env_id,
+            "description": f"Mock {task_type} task in {env['name']} environment",
+            "success_criteria": _SUCCESS_CRITERIA,
+        }
+        for task_type in env["tasks"]
+    ]
+    for env_id, env in PLAYGROUND_ENVIRONMENTS.items()
+}
+_FEEDBACK_POOL = [
+    "Agent successfully completed primary objectives",
+    "Good error recovery mechanisms observed",
+    "Could improve interaction speed",
+    "Effective use of available tools"
+]
+_EXECUTION_LOG = [
+    "Step 1: Initializing agent",
+    "Step 2: Navigating to URL",
+    "...",
+    "Step n: Finished"
+]
+
+# Mock leaderboard is a constant payload; the common no-filter case is
+# serialized once here, and filtered responses reuse the entry list/total.
+_LEADERBOARD_ENTRIES = [
+    {"rank": 1, "agent_name": "GPT-4 Turbo", "score": 94.2, "evaluations": 45},
+    {"rank": 2, "agent_name": "Claude-3 Opus", "score": 91.8, "evaluations": 38},
+    {"rank": 3, "agent_name": "Custom Agent V2", "score": 87.5, "evaluations": 22},
+    {"rank": 4, "agent_name": "Gemini Pro", "score": 84.1, "evaluations": 31},
+    {"rank": 5, "agent_name": "Custom Agent V1", "score": 79.3, "evaluations": 15}
+]
+_LEADERBOARD_TOTAL = sum(entry["evaluations"] for entry in _LEADERBOARD_ENTRIES)
+_LEADERBOARD_JSON_ALL = orjson.dumps({
+    "environment": "all",
+    "leaderboard": _LEADERBOARD_ENTRIES,
+    "last_updated": "2024-01-15T12:00:00Z",
+    "total_evaluations": _LEADERBOARD_TOTAL,
+})
+
 @router.get("/health")
 async def check_playground_health(current_user: User = Depends(get_current_user)):
     """Check the health of the playground system."""
     try:
-        # Create playground service using factory
+        # Process-scoped service from the factory (resolved once, reused)
         playground_service = await PlaygroundServiceFactory.create_service()
-        
-        # Check playground health
-        playground_healthy = await playground_service.health_check()
-        
-        # Check LLM service health
+
+        # The two subsystem probes are independent I/O — run them
+        # concurrently so the endpoint's latency is the max, not the sum.
         llm_factory = LLMClientFactory()
-        llm_health = await llm_factory.health_check_all_providers()
+        playground_healthy, llm_health = await asyncio.gather(
+            playground_service.health_check(),
+            llm_factory.health_check_all_providers(),
+            return_exceptions=True,
+        )
+        if isinstance(playground_healthy, Exception):
+            playground_healthy = False
+        if isinstance(llm_health, Exception):
+            llm_health = {}
         llm_service_ready = any(llm_health.values())
         
         # Get supported providers
@@ -79,8 +154,8 @@ async def check_playground_health(current_user: User = Depends(get_current_user)
             "playground_version": "1.0.0",
             "supported_providers": supported_providers,
             "available_providers": available_providers,
-            "supported_environments": list(PLAYGROUND_ENVIRONMENTS.keys()),
-            "timestamp": datetime.utcnow().isoformat()
+            "supported_environments": _ENV_KEYS,
+            "timestamp": cached_now_iso()
         }
     except Exception as e:
         return {
@@ -89,23 +164,24 @@ async def check_playground_health(current_user: User = Depends(get_current_user)
             "evaluation_service": False,
             "mock_mode": True,
             "error": str(e),
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": cached_now_iso()
         }
 
 @router.get("/environments")
 async def get_playground_environments(current_user: User = Depends(get_current_user)):
     """Get available playground environments."""
-    return list(PLAYGROUND_ENVIRONMENTS.keys())
+    return _ENV_KEYS
 
 @router.get("/environments/{environment_id}")
 async def get_environment_details(
     environment_id: str,
     current_user: User = Depends(get_current_user)
 ):
-    if environment_id not in PLAYGROUND_ENVIRONMENTS:
+    details = _ENV_DETAILS_JSON.get(environment_id)
+    if details is None:
         raise HTTPException(status_code=404, detail="Environment not found")
-    
-    return PLAYGROUND_ENVIRONMENTS[environment_id]
+
+    return Response(content=details, media_type="application/json")
 
 @router.get("/environments/{environment_id}/tasks", response_model=List[Dict[str, Any]])
 async def get_environment_tasks(
@@ -113,31 +189,20 @@ async def get_environment_tasks(
     difficulty: TaskDifficulty = None,
     current_user = Depends(get_current_user)
 ):
-    if environment_id not in PLAYGROUND_ENVIRONMENTS:
+    templates = _TASK_TEMPLATES.get(environment_id)
+    if templates is None:
         raise HTTPException(status_code=404, detail="Environment not found")
-    
-    env = PLAYGROUND_ENVIRONMENTS[environment_id]
+
     tasks = []
-    
-    for task_type in env["tasks"]:
+    for template in templates:
         task = {
-            "id": f"{environment_id}_{task_type}",
-            "name": task_type.replace("_", " ").title(),
-            "type": task_type,
-            "environment": environment_id,
-            "difficulty": difficulty or random.choice(list(TaskDifficulty)),
-            "description": f"Mock {task_type} task in {env['name']} environment",
-            "estimated_time": f"{random.randint(5, 30)} minutes",
-            "success_criteria": [
-                "Complete the task objective",
-                "Maintain proper interaction flow", 
-                "Handle errors gracefully"
-            ]
+            **template,
+            "difficulty": difficulty or _rng.choice(_TASK_DIFFICULTIES),
+            "estimated_time": f"{_rng.randint(5, 30)} minutes",
         }
-        
         if difficulty is None or task["difficulty"] == difficulty:
             tasks.append(task)
-    
+
     return tasks
 
 @router.post("/evaluate")
@@ -153,14 +218,16 @@ async def run_playground_evaluation(
         if not environment_id or environment_id not in PLAYGROUND_ENVIRONMENTS:
             raise HTTPException(status_code=400, detail="Invalid environment_id")
         
-        evaluation_id = str(uuid.uuid4())
+        # .hex skips the dash formatting; these ids are synthetic mock
+        # handles, never stored or indexed.
+        evaluation_id = uuid4().hex
         
         logger.info(f"Starting mock evaluation {evaluation_id} for {task_id}")
         
         await asyncio.sleep(1)
-        
-        success_rate = random.uniform(0.6, 0.95)
-        
+
+        success_rate = _rng.uniform(0.6, 0.95)
+
         results = {
             "evaluation_id": evaluation_id,
             "environment": environment_id,
@@ -170,24 +237,19 @@ async def run_playground_evaluation(
             "results": {
                 "success": success_rate > 0.7,
                 "success_rate": round(success_rate, 3),
-                "steps_completed": random.randint(8, 25),
-                "total_steps": random.randint(15, 30),
-                "execution_time": f"{random.randint(45, 180)} seconds",
-                "errors_encountered": random.randint(0, 3),
+                "steps_completed": _rng.randint(8, 25),
+                "total_steps": _rng.randint(15, 30),
+                "execution_time": f"{_rng.randint(45, 180)} seconds",
+                "errors_encountered": _rng.randint(0, 3),
                 "score": round(success_rate * 100, 1)
             },
             "metrics": {
                 "task_completion": round(success_rate, 3),
-                "efficiency": round(random.uniform(0.7, 0.9), 3),
-                "error_handling": round(random.uniform(0.6, 0.95), 3),
-                "adaptability": round(random.uniform(0.5, 0.9), 3)
+                "efficiency": round(_rng.uniform(0.7, 0.9), 3),
+                "error_handling": round(_rng.uniform(0.6, 0.95), 3),
+                "adaptability": round(_rng.uniform(0.5, 0.9), 3)
             },
-            "feedback": [
-                "Agent successfully completed primary objectives",
-                "Good error recovery mechanisms observed",
-                "Could improve interaction speed",
-                "Effective use of available tools"
-            ][:random.randint(2, 4)]
+            "feedback": _FEEDBACK_POOL[:_rng.randint(2, 4)]
         }
         
         return results
@@ -218,19 +280,14 @@ async def get_playground_leaderboard(
     environment_id: str = None,
     current_user = Depends(get_current_user)
 ):
-    mock_entries = [
-        {"rank": 1, "agent_name": "GPT-4 Turbo", "score": 94.2, "evaluations": 45},
-        {"rank": 2, "agent_name": "Claude-3 Opus", "score": 91.8, "evaluations": 38},
-        {"rank": 3, "agent_name": "Custom Agent V2", "score": 87.5, "evaluations": 22},
-        {"rank": 4, "agent_name": "Gemini Pro", "score": 84.1, "evaluations": 31},
-        {"rank": 5, "agent_name": "Custom Agent V1", "score": 79.3, "evaluations": 15}
-    ]
-    
+    if environment_id is None:
+        return Response(content=_LEADERBOARD_JSON_ALL, media_type="application/json")
+
     return {
-        "environment": environment_id or "all",
-        "leaderboard": mock_entries,
+        "environment": environment_id,
+        "leaderboard": _LEADERBOARD_ENTRIES,
         "last_updated": "2024-01-15T12:00:00Z",
-        "total_evaluations": sum(entry["evaluations"] for entry in mock_entries)
+        "total_evaluations": _LEADERBOARD_TOTAL
     }
 
 # -----------------------------------------------------------------------------
@@ -244,20 +301,15 @@ async def run_playground_direct(
 ):
     """Mock execution of agent against a task, returning synthetic results."""
 
-    execution_id = str(uuid.uuid4())
-    steps_taken = random.randint(10, 60)
-    total_time_seconds = round(random.uniform(5.0, 120.0), 2)
+    execution_id = uuid4().hex
+    steps_taken = _rng.randint(10, 60)
+    total_time_seconds = round(_rng.uniform(5.0, 120.0), 2)
 
     return {
         "execution_id": execution_id,
-        "status": random.choice(["completed", "failed"]),
+        "status": _rng.choice(("completed", "failed")),
         "steps_taken": steps_taken,
         "total_time_seconds": total_time_seconds,
-        "success_rate": round(random.uniform(0.5, 1.0), 2),
-        "execution_log": [
-            "Step 1: Initializing agent",
-            "Step 2: Navigating to URL",
-            "...",
-            "Step n: Finished"
-        ],
+        "success_rate": round(_rng.uniform(0.5, 1.0), 2),
+        "execution_log": _EXECUTION_LOG,
     }
\ No newline at end of file
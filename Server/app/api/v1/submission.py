@@ -1,14 +1,16 @@
-from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi import APIRouter, Depends, Query
+from fastapi_cache.decorator import cache
 from sqlalchemy.orm import Session
 from ...db.database import get_db
 from fastapi import BackgroundTasks
 from ...controllers.submission_controller import SubmissionController
 from ...schemas.submission_schema import (
-    SubmissionCreate, 
-    SubmissionResponse, 
-    SubmissionListResponse,
+    SubmissionCreate,
+    SubmissionResponse,
     LeaderboardResponse
 )
+from ...core.cache import public_request_key_builder
+from ...core.config import settings
 from ...core.security import get_current_user
 import uuid
 
@@ -24,20 +26,12 @@ async def submit_agent(
     controller = SubmissionController(db)
     return await controller.create_submission(submission, current_user.id, background_tasks)  
 
-@router.get("/my", response_model=SubmissionListResponse)
-async def get_my_submissions_endpoint(
-    skip: int = Query(0, ge=0),
-    limit: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db),
-    current_user = Depends(get_current_user)
-):
-    controller = SubmissionController(db)
-    return await controller.get_user_submissions(
-        current_user.id,
-        skip=skip,
-        limit=limit
-    )
-
+# One handler registered under both paths: /submissions/my is the documented
+# route, bare /submissions is kept for older clients. No response_model: the
+# controller already emits the exact flat dicts the clients expect, so
+# revalidating (and re-shaping) them per row would only add per-item
+# pydantic cost — the dicts go straight to ORJSON serialization.
+@router.get("/my")
 @router.get("")
 async def get_my_submissions(
     skip: int = Query(0, ge=0),
@@ -54,43 +48,33 @@ async def get_my_submissions(
 
 @router.get("/{submission_id}")
 async def get_submission(
-    submission_id: str,
+    submission_id: uuid.UUID,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
-    try:
-        submission_uuid = uuid.UUID(submission_id)
-        controller = SubmissionController(db)
-        return await controller.get_submission_details(submission_uuid, current_user.id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid submission ID format")
+    controller = SubmissionController(db)
+    return await controller.get_submission_details(submission_id, current_user.id)
 
 @router.get("/leaderboard/{task_id}", response_model=list[LeaderboardResponse])
+@cache(expire=settings.LEADERBOARD_CACHE_TTL, namespace="leaderboards", key_builder=public_request_key_builder)
 async def get_leaderboard(
-    task_id: str,
+    task_id: uuid.UUID,
+    limit: int = Query(50, ge=1, le=500),
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
-    try:
-        task_uuid = uuid.UUID(task_id)
-        controller = SubmissionController(db)
-        return await controller.get_leaderboard(task_uuid)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid task ID format")
+    controller = SubmissionController(db)
+    return await controller.get_leaderboard(task_id, limit=limit)
 
-@router.get("/task/{task_id}", response_model=SubmissionListResponse)
+@router.get("/task/{task_id}")
 async def get_my_submissions_by_task(
-    task_id: str,
+    task_id: uuid.UUID,
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
-    try:
-        task_uuid = uuid.UUID(task_id)
-        controller = SubmissionController(db)
-        return await controller.get_user_submissions_by_task(
-            current_user.id, task_uuid, skip=skip, limit=limit
-        )
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid task ID format")
\ No newline at end of file
+    controller = SubmissionController(db)
+    return await controller.get_user_submissions_by_task(
+        current_user.id, task_id, skip=skip, limit=limit
+    )
\ No newline at end of file
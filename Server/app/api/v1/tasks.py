@@ -1,10 +1,14 @@
-from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi import APIRouter, Depends, Query, Response
+from fastapi_cache.decorator import cache
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 from ...db.database import get_db
 from ...controllers.task_controller import TaskController
 from ...controllers.submission_controller import SubmissionController
 from ...schemas.task_schema import TaskCreate, TaskUpdate, TaskResponse, TaskListResponse
 from ...schemas.submission_schema import LeaderboardResponse
+from ...core.cache import invalidate_namespace, public_request_key_builder
+from ...core.config import settings
 from ...core.security import get_current_user
 import uuid
 
@@ -17,37 +21,40 @@ async def create_task(
     current_user = Depends(get_current_user)
 ):
     controller = TaskController(db)
-    return await controller.create_task(task, current_user.id)
+    # Controller methods run sync SQLAlchemy; dispatch them to the
+    # threadpool so they never block the event loop.
+    result = await run_in_threadpool(controller.create_task, task, current_user.id)
+    await invalidate_namespace("tasks")
+    return result
 
 @router.get("", status_code=200)
+@cache(expire=settings.TASK_CACHE_TTL, namespace="tasks", key_builder=public_request_key_builder)
 async def get_tasks(
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
     db: Session = Depends(get_db),
 ):
     controller = TaskController(db)
-    result = await controller.get_tasks(skip, limit)
-    return result
+    return await run_in_threadpool(controller.get_tasks, skip, limit)
 
 @router.get("/{task_id}")
+@cache(expire=settings.TASK_CACHE_TTL, namespace="tasks", key_builder=public_request_key_builder)
 async def get_task(
     task_id: str,
     db: Session = Depends(get_db),
 ):
     controller = TaskController(db)
-    return await controller.get_task(task_id)
+    return await run_in_threadpool(controller.get_task, task_id)
 
 @router.get("/{task_id}/leaderboard", response_model=list[LeaderboardResponse])
+@cache(expire=settings.LEADERBOARD_CACHE_TTL, namespace="leaderboards", key_builder=public_request_key_builder)
 async def get_task_leaderboard(
-    task_id: str,
+    task_id: uuid.UUID,
+    limit: int = Query(50, ge=1, le=500),
     db: Session = Depends(get_db),
 ):
-    try:
-        task_uuid = uuid.UUID(task_id)
-        controller = SubmissionController(db)
-        return await controller.get_leaderboard(task_uuid)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid task ID format")
+    controller = SubmissionController(db)
+    return await controller.get_leaderboard(task_id, limit=limit)
 
 @router.put("/{task_id}")
 async def update_task(
@@ -57,14 +64,19 @@ async def update_task(
     current_user = Depends(get_current_user)
 ):
     controller = TaskController(db)
-    return await controller.update_task(task_id, task)
+    result = await run_in_threadpool(controller.update_task, task_id, task)
+    await invalidate_namespace("tasks")
+    return result
 
-@router.delete("/{task_id}")
+# 204 with a bare Response: a delete has no body to encode, so the whole
+# jsonable_encoder/response-serialization pipeline is skipped.
+@router.delete("/{task_id}", status_code=204, response_class=Response)
 async def delete_task(
     task_id: str,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
     controller = TaskController(db)
-    await controller.delete_task(task_id)
-    return {"message": "Task deleted successfully"}
\ No newline at end of file
+    await run_in_threadpool(controller.delete_task, task_id)
+    await invalidate_namespace("tasks")
+    return Response(status_code=204)
\ No newline at end of file
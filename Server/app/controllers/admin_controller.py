@@ -1,6 +1,6 @@
-from fastapi import HTTPException, Depends
+from fastapi import HTTPException
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc, and_
+from sqlalchemy import Float, func, desc, and_, bindparam, case, cast, select
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 from ..models.user import User
@@ -11,470 +11,591 @@ from ..models.evaluation import EvaluationResult
 from ..models.leaderboard import Leaderboard
 from ..models.enums import UserRole, TaskDifficulty, SubmissionStatus, EvaluationStatus
 from ..schemas.admin_schema import AdminDashboardStats, UserManagementRequest, TaskAnalytics
-from ..core.security import get_current_user
+from ..api.dependencies import invalidate_user_cache
 import json
 
+# In-process daily_stats rollup: the 30-day performance trend and the
+# per-environment aggregates scan whole tables, so a background refresher
+# (spawned in admin.py) recomputes them on a schedule and admin reads serve
+# the precomputed copy. This stands in for a Postgres materialized view —
+# the dev/test stack runs SQLite and has no external scheduler.
+_daily_stats: Dict[str, Any] = {}
+
+# Dashboard statements, built once at import: handlers execute prebuilt
+# selects instead of reconstructing the query tree per request, and the
+# fixed statement identity keeps the engine's compiled-SQL cache warm.
+# Time cutoffs travel as bindparams so the cached plan is reused.
+_USER_STATS_STMT = select(
+    func.count(User.id),
+    func.sum(case((User.isActive == True, 1), else_=0)),
+    func.sum(case((User.createdAt >= bindparam("week_cutoff"), 1), else_=0)),
+)
+_AGENT_STATS_STMT = select(
+    func.count(Agent.id),
+    func.sum(case((Agent.isActive == True, 1), else_=0)),
+)
+_TASK_DIFFICULTY_STMT = select(
+    Task.difficulty, func.count(Task.id)
+).group_by(Task.difficulty)
+# FILTER (WHERE ...) aggregates: every status bucket plus the 24h-activity
+# counter come back as one row of one scan, with no Python-side unpacking
+# of GROUP BY buckets.
+_SUBMISSION_STATS_STMT = select(
+    func.count(Submission.id),
+    func.count(Submission.id).filter(Submission.status == SubmissionStatus.COMPLETED),
+    func.count(Submission.id).filter(Submission.status == SubmissionStatus.FAILED),
+    func.count(Submission.id).filter(
+        Submission.status.in_((SubmissionStatus.PENDING, SubmissionStatus.PROCESSING))
+    ),
+    func.count(Submission.id).filter(Submission.submittedAt >= bindparam("day_cutoff")),
+)
+_EVAL_AVERAGES_STMT = select(
+    func.avg(EvaluationResult.score), func.avg(EvaluationResult.timeTaken)
+)
+_ENV_USAGE_STMT = (
+    select(Task.webArenaEnvironment, func.count(Submission.id))
+    .join(Submission, Submission.taskId == Task.id)
+    .group_by(Task.webArenaEnvironment)
+)
+
+
 class AdminController:
-    def __init__(self, db: Session):
-        self.db = db
+    """Stateless admin analytics/management facade.
 
-    def get_dashboard_stats(self, current_user: User = Depends(get_current_user)) -> AdminDashboardStats:
+    Holds no per-request state: every method takes the session it should
+    run against, so one module-level instance (``admin_controller``) is
+    shared by all requests instead of being rebuilt per call.
+    """
+
+    def get_dashboard_stats(self, db: Session) -> AdminDashboardStats:
         """Get comprehensive dashboard statistics for admin"""
-        if current_user.role != UserRole.ADMIN:
-            raise HTTPException(status_code=403, detail="Admin access required")
-        
-        try:
-            # User Statistics
-            total_users = self.db.query(User).count()
-            active_users = self.db.query(User).filter(User.isActive == True).count()
-            new_users_week = self.db.query(User).filter(
-                User.createdAt >= datetime.utcnow() - timedelta(days=7)
-            ).count()
-            
-            # Agent Statistics
-            total_agents = self.db.query(Agent).count()
-            active_agents = self.db.query(Agent).filter(Agent.isActive == True).count()
-            
-            # Task Statistics
-            total_tasks = self.db.query(Task).count()
-            easy_tasks = self.db.query(Task).filter(Task.difficulty == TaskDifficulty.EASY).count()
-            medium_tasks = self.db.query(Task).filter(Task.difficulty == TaskDifficulty.MEDIUM).count()
-            hard_tasks = self.db.query(Task).filter(Task.difficulty == TaskDifficulty.HARD).count()
-            
-            # Submission Statistics
-            total_submissions = self.db.query(Submission).count()
-            completed_submissions = self.db.query(Submission).filter(
-                Submission.status == SubmissionStatus.COMPLETED
-            ).count()
-            failed_submissions = self.db.query(Submission).filter(
-                Submission.status == SubmissionStatus.FAILED
-            ).count()
-            pending_submissions = self.db.query(Submission).filter(
-                Submission.status.in_([SubmissionStatus.PENDING, SubmissionStatus.PROCESSING])
-            ).count()
-            
-            # Success rate
-            success_rate = (completed_submissions / total_submissions * 100) if total_submissions > 0 else 0
-            
-            # Recent activity
-            recent_submissions = self.db.query(Submission).filter(
-                Submission.submittedAt >= datetime.utcnow() - timedelta(hours=24)
-            ).count()
-            
-            # Average scores
-            avg_score = self.db.query(func.avg(EvaluationResult.score)).scalar() or 0
-            
-            # Environment usage
-            environment_usage = self.db.query(
-                Task.webArenaEnvironment,
-                func.count(Submission.id).label('submissions_count')
-            ).join(Submission).group_by(Task.webArenaEnvironment).all()
-            
-            dashboard = {
-                "total_users": total_users,
-                "total_agents": total_agents,
-                "total_tasks": total_tasks,
-                "total_submissions": total_submissions,
-                "activity_metrics": {
-                    "recent_submissions_24h": recent_submissions,
-                    "avg_completion_time": self._get_avg_completion_time(),
-                    "most_popular_environment": self._get_most_popular_environment()
-                },
-                "submission_metrics": {
-                    "completed": completed_submissions,
-                    "failed": failed_submissions,
-                    "pending": pending_submissions,
-                    "success_rate": round(success_rate, 2),
-                    "average_score": round(avg_score, 2)
-                },
-                "task_distribution": {
-                    "easy": easy_tasks,
-                    "medium": medium_tasks,
-                    "hard": hard_tasks
-                },
-                "environment_usage": {env: count for env, count in environment_usage},
-                "system_health": {
-                    "database_status": "healthy",
-                    "api_status": "operational",
-                    "evaluation_service": "running"
-                }
+        now = datetime.utcnow()
+
+        # User Statistics: total/active/new-this-week as conditional
+        # aggregates in one scan instead of three COUNT round-trips.
+        total_users, active_users, new_users_week = db.execute(
+            _USER_STATS_STMT, {"week_cutoff": now - timedelta(days=7)}
+        ).one()
+        active_users = active_users or 0
+        new_users_week = new_users_week or 0
+
+        # Agent Statistics
+        total_agents, active_agents = db.execute(_AGENT_STATS_STMT).one()
+        active_agents = active_agents or 0
+
+        # Task Statistics: one GROUP BY instead of a COUNT per difficulty
+        difficulty_counts = dict(db.execute(_TASK_DIFFICULTY_STMT).all())
+        total_tasks = sum(difficulty_counts.values())
+
+        # Submission Statistics: filtered aggregates replace the four
+        # per-status COUNTs, and the 24h-activity counter rides along.
+        (
+            total_submissions,
+            completed_submissions,
+            failed_submissions,
+            pending_submissions,
+            recent_submissions,
+        ) = db.execute(
+            _SUBMISSION_STATS_STMT, {"day_cutoff": now - timedelta(hours=24)}
+        ).one()
+
+        # Success rate
+        success_rate = (completed_submissions / total_submissions * 100) if total_submissions > 0 else 0
+
+        # Evaluation aggregates: average score and completion time share a scan
+        avg_score, avg_completion_time = db.execute(_EVAL_AVERAGES_STMT).one()
+        avg_score = avg_score or 0
+
+        # Environment usage; the busiest environment falls out of the same rows
+        environment_usage = db.execute(_ENV_USAGE_STMT).all()
+        most_popular_environment = (
+            max(environment_usage, key=lambda row: row[1])[0] if environment_usage else "N/A"
+        )
+
+        dashboard = {
+            "total_users": total_users,
+            "total_agents": total_agents,
+            "total_tasks": total_tasks,
+            "total_submissions": total_submissions,
+            "activity_metrics": {
+                "recent_submissions_24h": recent_submissions,
+                "avg_completion_time": round(avg_completion_time, 2) if avg_completion_time else 0,
+                "most_popular_environment": most_popular_environment
+            },
+            "submission_metrics": {
+                "completed": completed_submissions,
+                "failed": failed_submissions,
+                "pending": pending_submissions,
+                "success_rate": round(success_rate, 2),
+                "average_score": round(avg_score, 2)
+            },
+            "task_distribution": {
+                "easy": difficulty_counts.get(TaskDifficulty.EASY, 0),
+                "medium": difficulty_counts.get(TaskDifficulty.MEDIUM, 0),
+                "hard": difficulty_counts.get(TaskDifficulty.HARD, 0)
+            },
+            "environment_usage": {env: count for env, count in environment_usage},
+            "system_health": {
+                "database_status": "healthy",
+                "api_status": "operational",
+                "evaluation_service": "running"
             }
-            return dashboard
-            
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Error fetching dashboard stats: {str(e)}")
+        }
+        return dashboard
+        
 
-    def get_user_analytics(self, current_user: User = Depends(get_current_user)) -> Dict[str, Any]:
+    def get_user_analytics(self, db: Session) -> Dict[str, Any]:
         """Get detailed user analytics and behavior patterns"""
-        if current_user.role != UserRole.ADMIN:
-            raise HTTPException(status_code=403, detail="Admin access required")
+        # User registration trends (last 30 days): one GROUP BY day
+        # instead of thirty per-day COUNT queries; days with no signups
+        # are zero-filled in Python.
+        now = datetime.utcnow()
+        day = func.date(User.createdAt).label('day')
+        signup_rows = db.query(day, func.count(User.id)).filter(
+            User.createdAt >= now - timedelta(days=30)
+        ).group_by(day).all()
+        signups_by_day = {str(row[0]): row[1] for row in signup_rows}
+
+        registration_trend = []
+        for i in range(30):
+            date = now - timedelta(days=i)
+            registration_trend.append({
+                "date": date.strftime("%Y-%m-%d"),
+                "registrations": signups_by_day.get(date.strftime("%Y-%m-%d"), 0)
+            })
+
+        # Top performing users: the display name is concatenated and
+        # trimmed in SQL so the response loop does no per-row string
+        # work, and HAVING prunes users with no evaluated submissions.
+        display_name = func.trim(
+            User.firstName + ' ' + func.coalesce(User.lastName, '')
+        ).label('display_name')
+        top_users = db.query(
+            User.id,
+            display_name,
+            User.email,
+            func.count(func.distinct(Submission.id)).label('submission_count'),
+            func.avg(EvaluationResult.score).label('avg_score')
+        ).join(Submission, Submission.userId == User.id).join(
+            EvaluationResult, EvaluationResult.submissionId == Submission.id
+        ).group_by(User.id).having(
+            func.count(Submission.id) >= 1
+        ).order_by(desc('avg_score')).limit(10).all()
+
+        # Agent type distribution
+        agent_types = db.query(
+            Agent.agentType,
+            func.count(Agent.id).label('count')
+        ).group_by(Agent.agentType).all()
+        
+        return {
+            "registration_trend": registration_trend,
+            "top_performers": [
+                {
+                    "user_id": user.id,
+                    "name": user.display_name,
+                    "email": user.email,
+                    "submissions": user.submission_count,
+                    "average_score": round(user.avg_score, 2) if user.avg_score else 0
+                }
+                for user in top_users
+            ],
+            "agent_distribution": {agent_type: count for agent_type, count in agent_types},
+            "user_engagement": self._get_user_engagement_metrics(db, now)
+        }
         
-        try:
-            # User registration trends (last 30 days)
-            registration_trend = []
-            for i in range(30):
-                date = datetime.utcnow() - timedelta(days=i)
-                count = self.db.query(User).filter(
-                    func.date(User.createdAt) == date.date()
-                ).count()
-                registration_trend.append({
-                    "date": date.strftime("%Y-%m-%d"),
-                    "registrations": count
-                })
-            
-            # Top performing users
-            top_users = self.db.query(
-                User.id,
-                User.firstName,
-                User.lastName,
-                User.email,
-                func.count(Submission.id).label('submission_count'),
-                func.avg(EvaluationResult.score).label('avg_score')
-            ).join(Submission).join(EvaluationResult).group_by(User.id).order_by(
-                desc('avg_score')
-            ).limit(10).all()
-            
-            # Agent type distribution
-            agent_types = self.db.query(
-                Agent.agentType,
-                func.count(Agent.id).label('count')
-            ).group_by(Agent.agentType).all()
-            
-            return {
-                "registration_trend": registration_trend,
-                "top_performers": [
-                    {
-                        "user_id": user.id,
-                        "name": f"{user.firstName} {user.lastName or ''}".strip(),
-                        "email": user.email,
-                        "submissions": user.submission_count,
-                        "average_score": round(user.avg_score, 2) if user.avg_score else 0
-                    }
-                    for user in top_users
-                ],
-                "agent_distribution": {agent_type: count for agent_type, count in agent_types},
-                "user_engagement": self._get_user_engagement_metrics()
-            }
-            
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Error fetching user analytics: {str(e)}")
 
-    def get_task_analytics(self, current_user: User = Depends(get_current_user)) -> Dict[str, Any]:
+    def get_task_analytics(self, db: Session) -> Dict[str, Any]:
         """Get comprehensive task performance analytics"""
-        if current_user.role != UserRole.ADMIN:
-            raise HTTPException(status_code=403, detail="Admin access required")
+        # Task completion rates
+        task_performance = db.query(
+            Task.id,
+            Task.title,
+            Task.difficulty,
+            Task.webArenaEnvironment,
+            func.count(Submission.id).label('total_attempts'),
+            func.sum(
+                case((Submission.status == SubmissionStatus.COMPLETED, 1), else_=0)
+            ).label('successful_completions'),
+            func.avg(EvaluationResult.score).label('avg_score'),
+            func.avg(EvaluationResult.timeTaken).label('avg_time')
+        ).outerjoin(Submission, Submission.taskId == Task.id).outerjoin(
+            EvaluationResult, EvaluationResult.submissionId == Submission.id
+        ).group_by(Task.id).yield_per(500)
         
-        try:
-            # Task completion rates
-            task_performance = self.db.query(
-                Task.id,
-                Task.title,
-                Task.difficulty,
-                Task.webArenaEnvironment,
-                func.count(Submission.id).label('total_attempts'),
-                func.count(
-                    func.case([(Submission.status == SubmissionStatus.COMPLETED, 1)])
-                ).label('successful_completions'),
-                func.avg(EvaluationResult.score).label('avg_score'),
-                func.avg(EvaluationResult.timeTaken).label('avg_time')
-            ).outerjoin(Submission).outerjoin(EvaluationResult).group_by(Task.id).all()
-            
-            # Difficulty analysis
-            difficulty_stats = {}
-            for difficulty in TaskDifficulty:
-                stats = self.db.query(
-                    func.count(Task.id).label('task_count'),
-                    func.avg(EvaluationResult.score).label('avg_score'),
-                    func.avg(EvaluationResult.timeTaken).label('avg_time')
-                ).join(Submission).join(EvaluationResult).filter(
-                    Task.difficulty == difficulty
-                ).first()
-                
-                difficulty_stats[difficulty.value] = {
-                    "task_count": stats.task_count if stats.task_count else 0,
-                    "average_score": round(stats.avg_score, 2) if stats.avg_score else 0,
-                    "average_time": round(stats.avg_time, 2) if stats.avg_time else 0
-                }
-            
-            return {
-                "task_performance": [
-                    {
-                        "task_id": task.id,
-                        "title": task.title,
-                        "difficulty": task.difficulty.value,
-                        "environment": task.webArenaEnvironment,
-                        "total_attempts": task.total_attempts or 0,
-                        "successful_completions": task.successful_completions or 0,
-                        "success_rate": round(
-                            (task.successful_completions / task.total_attempts * 100) 
-                            if task.total_attempts > 0 else 0, 2
-                        ),
-                        "average_score": round(task.avg_score, 2) if task.avg_score else 0,
-                        "average_time": round(task.avg_time, 2) if task.avg_time else 0
-                    }
-                    for task in task_performance
-                ],
-                "difficulty_analysis": difficulty_stats,
-                "environment_performance": self._get_environment_performance()
+        # Difficulty analysis: one GROUP BY instead of an aggregate query
+        # per difficulty level; levels with no evaluated submissions fall
+        # back to zeros.
+        difficulty_rows = db.query(
+            Task.difficulty,
+            func.count(func.distinct(Task.id)).label('task_count'),
+            func.avg(EvaluationResult.score).label('avg_score'),
+            func.avg(EvaluationResult.timeTaken).label('avg_time')
+        ).join(Submission, Submission.taskId == Task.id).join(
+            EvaluationResult, EvaluationResult.submissionId == Submission.id
+        ).group_by(Task.difficulty).all()
+        stats_by_difficulty = {row[0]: row for row in difficulty_rows}
+
+        difficulty_stats = {}
+        for difficulty in TaskDifficulty:
+            stats = stats_by_difficulty.get(difficulty)
+            difficulty_stats[difficulty.value] = {
+                "task_count": stats.task_count if stats else 0,
+                "average_score": round(stats.avg_score, 2) if stats and stats.avg_score else 0,
+                "average_time": round(stats.avg_time, 2) if stats and stats.avg_time else 0
             }
-            
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Error fetching task analytics: {str(e)}")
 
-    def get_real_time_monitoring(self, current_user: User = Depends(get_current_user)) -> Dict[str, Any]:
-        """Get real-time system monitoring data"""
-        if current_user.role != UserRole.ADMIN:
-            raise HTTPException(status_code=403, detail="Admin access required")
+        return {
+            "task_performance": [
+                {
+                    "task_id": task.id,
+                    "title": task.title,
+                    "difficulty": task.difficulty.value,
+                    "environment": task.webArenaEnvironment,
+                    "total_attempts": task.total_attempts or 0,
+                    "successful_completions": task.successful_completions or 0,
+                    "success_rate": round(
+                        (task.successful_completions / task.total_attempts * 100) 
+                        if task.total_attempts > 0 else 0, 2
+                    ),
+                    "average_score": round(task.avg_score, 2) if task.avg_score else 0,
+                    "average_time": round(task.avg_time, 2) if task.avg_time else 0
+                }
+                for task in task_performance
+            ],
+            "difficulty_analysis": difficulty_stats,
+            "environment_performance": self._get_environment_performance(db)
+        }
         
-        try:
-            # Active submissions (last hour)
-            active_submissions = self.db.query(Submission).filter(
-                and_(
-                    Submission.status.in_([SubmissionStatus.PENDING, SubmissionStatus.PROCESSING]),
-                    Submission.submittedAt >= datetime.utcnow() - timedelta(hours=1)
-                )
+
+    def get_real_time_monitoring(self, db: Session) -> Dict[str, Any]:
+        """Get real-time system monitoring data"""
+        now = datetime.utcnow()
+
+        # Active submissions (last hour); only the serialized columns are
+        # selected, so rows stay narrow and skip ORM identity bookkeeping.
+        active_submissions = db.query(
+            Submission.id,
+            Submission.userId,
+            Submission.taskId,
+            Submission.status,
+            Submission.submittedAt,
+        ).filter(
+            and_(
+                Submission.status.in_([SubmissionStatus.PENDING, SubmissionStatus.PROCESSING]),
+                Submission.submittedAt >= now - timedelta(hours=1)
+            )
+        ).all()
+
+        # System load indicators: the three independent counters (queue
+        # length, in-flight count, completions in the last hour) are
+        # conditional aggregates over one scan instead of three COUNTs.
+        queue_length, processing_count, recent_completions = db.query(
+            func.sum(case((Submission.status == SubmissionStatus.QUEUED, 1), else_=0)),
+            func.sum(case((Submission.status == SubmissionStatus.PROCESSING, 1), else_=0)),
+            func.sum(case((and_(
+                Submission.status == SubmissionStatus.COMPLETED,
+                Submission.updatedAt >= now - timedelta(hours=1)
+            ), 1), else_=0)),
+        ).one()
+        queue_length = queue_length or 0
+        processing_count = processing_count or 0
+        recent_completions = recent_completions or 0
+
+        # Preload expected times for every referenced task in one IN query
+        # so the per-submission estimate below does no further SQL.
+        task_ids = {sub.taskId for sub in active_submissions}
+        expected_times = dict(
+            db.query(Task.id, Task.expectedCompletionTime).filter(
+                Task.id.in_(task_ids)
             ).all()
-            
-            # Recent completions (last hour)
-            recent_completions = self.db.query(Submission).filter(
-                and_(
-                    Submission.status == SubmissionStatus.COMPLETED,
-                    Submission.updatedAt >= datetime.utcnow() - timedelta(hours=1)
-                )
-            ).count()
-            
-            # System load indicators
-            queue_length = self.db.query(Submission).filter(
-                Submission.status == SubmissionStatus.QUEUED
-            ).count()
-            
-            processing_count = self.db.query(Submission).filter(
-                Submission.status == SubmissionStatus.PROCESSING
-            ).count()
-            
-            return {
-                "active_evaluations": len(active_submissions),
-                "queue_length": queue_length,
-                "processing_count": processing_count,
-                "recent_completions": recent_completions,
-                "system_load": {
-                    "evaluation_queue": queue_length,
-                    "active_processes": processing_count,
-                    "hourly_throughput": recent_completions
-                },
-                "active_submissions": [
-                    {
-                        "id": sub.id,
-                        "user_id": sub.userId,
-                        "task_id": sub.taskId,
-                        "status": sub.status.value,
-                        "submitted_at": sub.submittedAt.isoformat(),
-                        "estimated_completion": self._estimate_completion_time(sub)
-                    }
-                    for sub in active_submissions
-                ]
-            }
-            
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Error fetching monitoring data: {str(e)}")
+        ) if task_ids else {}
 
-    def manage_users(self, action: str, user_data: UserManagementRequest, 
-                    current_user: User = Depends(get_current_user)) -> Dict[str, Any]:
+        return {
+            "active_evaluations": len(active_submissions),
+            "queue_length": queue_length,
+            "processing_count": processing_count,
+            "recent_completions": recent_completions,
+            "system_load": {
+                "evaluation_queue": queue_length,
+                "active_processes": processing_count,
+                "hourly_throughput": recent_completions
+            },
+            "active_submissions": [
+                {
+                    "id": sub.id,
+                    "user_id": sub.userId,
+                    "task_id": sub.taskId,
+                    "status": sub.status,
+                    "submitted_at": sub.submittedAt.isoformat(),
+                    "estimated_completion": self._estimate_completion_time(
+                        sub, expected_times.get(sub.taskId), now
+                    )
+                }
+                for sub in active_submissions
+            ]
+        }
+        
+
+    def manage_users(self, db: Session, action: str, user_data: UserManagementRequest) -> Dict[str, Any]:
         """Manage users (activate, deactivate, promote, etc.)"""
-        if current_user.role != UserRole.ADMIN:
-            raise HTTPException(status_code=403, detail="Admin access required")
+        target_user = db.query(User).filter(User.id == user_data.user_id).first()
+        if not target_user:
+            raise HTTPException(status_code=404, detail="User not found")
         
-        try:
-            target_user = self.db.query(User).filter(User.id == user_data.user_id).first()
-            if not target_user:
-                raise HTTPException(status_code=404, detail="User not found")
-            
-            if action == "activate":
-                target_user.isActive = True
-            elif action == "deactivate":
-                target_user.isActive = False
-            elif action == "promote":
-                target_user.role = UserRole.ADMIN
-            elif action == "demote":
-                target_user.role = UserRole.USER
-            elif action == "verify_email":
-                target_user.isEmailVerified = True
-            else:
-                raise HTTPException(status_code=400, detail="Invalid action")
-            
-            self.db.commit()
-            
-            return {
-                "success": True,
-                "message": f"User {action} completed successfully",
-                "user": {
-                    "id": target_user.id,
-                    "email": target_user.email,
-                    "role": target_user.role.value,
-                    "is_active": target_user.isActive,
-                    "is_verified": target_user.isEmailVerified
-                }
+        if action == "activate":
+            target_user.isActive = True
+        elif action == "deactivate":
+            target_user.isActive = False
+        elif action == "promote":
+            target_user.role = UserRole.ADMIN
+            target_user.isAdmin = True
+        elif action == "demote":
+            target_user.role = UserRole.USER
+            target_user.isAdmin = False
+        elif action == "verify_email":
+            target_user.isEmailVerified = True
+        else:
+            raise HTTPException(status_code=400, detail="Invalid action")
+
+        db.commit()
+        invalidate_user_cache(target_user.id)
+        
+        return {
+            "success": True,
+            "message": f"User {action} completed successfully",
+            "user": {
+                "id": target_user.id,
+                "email": target_user.email,
+                "role": target_user.role.value,
+                "is_active": target_user.isActive,
+                "is_verified": target_user.isEmailVerified
             }
-            
-        except HTTPException:
-            raise
-        except Exception as e:
-            self.db.rollback()
-            raise HTTPException(status_code=500, detail=f"Error managing user: {str(e)}")
-
-    def get_leaderboard_insights(self, current_user: User = Depends(get_current_user)) -> Dict[str, Any]:
+        }
+        
+
+    _BULK_ACTION_VALUES = {
+        "activate": {"isActive": True},
+        "deactivate": {"isActive": False},
+        "promote": {"role": UserRole.ADMIN, "isAdmin": True},
+        "demote": {"role": UserRole.USER, "isAdmin": False},
+        "verify_email": {"isEmailVerified": True},
+    }
+
+    def manage_users_bulk(self, db: Session, action: str, user_ids: List[str]) -> Dict[str, Any]:
+        """Apply one management action to many users in a single UPDATE.
+
+        Every supported action is a plain column assignment, so the whole
+        batch is one UPDATE ... WHERE id IN (...) and one commit instead of
+        a SELECT + UPDATE + COMMIT per user.
+        """
+        values = self._BULK_ACTION_VALUES.get(action)
+        if values is None:
+            raise HTTPException(status_code=400, detail="Invalid action")
+
+        affected = db.query(User).filter(User.id.in_(user_ids)).update(
+            values, synchronize_session=False
+        )
+        db.commit()
+        for user_id in user_ids:
+            invalidate_user_cache(user_id)
+        return {
+            "success": True,
+            "message": f"User {action} completed for {affected} of {len(user_ids)} users",
+            "requested": len(user_ids),
+            "affected": affected,
+        }
+
+    def get_leaderboard_insights(self, db: Session) -> Dict[str, Any]:
         """Get comprehensive leaderboard and performance insights"""
-        if current_user.role != UserRole.ADMIN:
-            raise HTTPException(status_code=403, detail="Admin access required")
+        # Global top performers
+        global_leaderboard = db.query(
+            Agent.id,
+            Agent.name,
+            User.firstName,
+            User.lastName,
+            func.avg(Leaderboard.score).label('avg_score'),
+            func.count(Leaderboard.id).label('submissions'),
+            func.avg(Leaderboard.timeTaken).label('avg_time')
+        ).join(User).join(Leaderboard).group_by(Agent.id).order_by(
+            desc('avg_score')
+        ).limit(20).all()
         
-        try:
-            # Global top performers
-            global_leaderboard = self.db.query(
-                Agent.id,
-                Agent.name,
-                User.firstName,
-                User.lastName,
-                func.avg(Leaderboard.score).label('avg_score'),
-                func.count(Leaderboard.id).label('submissions'),
-                func.avg(Leaderboard.timeTaken).label('avg_time')
-            ).join(User).join(Leaderboard).group_by(Agent.id).order_by(
-                desc('avg_score')
-            ).limit(20).all()
-            
-            # Task-specific leaderboards
-            task_leaderboards = {}
-            tasks = self.db.query(Task).all()
-            
-            for task in tasks:
-                top_agents = self.db.query(
-                    Agent.id,
-                    Agent.name,
-                    Leaderboard.score,
-                    Leaderboard.timeTaken,
-                    Leaderboard.rank
-                ).join(Leaderboard).filter(
-                    Leaderboard.taskId == task.id
-                ).order_by(Leaderboard.rank).limit(5).all()
-                
-                task_leaderboards[task.id] = {
-                    "task_title": task.title,
-                    "top_agents": [
-                        {
-                            "agent_id": agent.id,
-                            "agent_name": agent.name,
-                            "score": agent.score,
-                            "time_taken": agent.timeTaken,
-                            "rank": agent.rank
-                        }
-                        for agent in top_agents
-                    ]
+        # Task-specific leaderboards: one windowed query returns the top
+        # five entries for every task instead of one query per task.
+        rn = func.row_number().over(
+            partition_by=Leaderboard.taskId, order_by=Leaderboard.rank
+        ).label('rn')
+        ranked = db.query(
+            Leaderboard.taskId.label('taskId'),
+            Agent.id.label('agent_id'),
+            Agent.name.label('agent_name'),
+            Leaderboard.score.label('score'),
+            Leaderboard.timeTaken.label('timeTaken'),
+            Leaderboard.rank.label('rank'),
+            rn
+        ).join(Agent, Agent.id == Leaderboard.agentId).subquery()
+        top_rows = db.query(ranked).filter(ranked.c.rn <= 5).order_by(
+            ranked.c.taskId, ranked.c.rn
+        ).all()
+
+        task_leaderboards = {
+            task_id: {"task_title": title, "top_agents": []}
+            for task_id, title in db.query(Task.id, Task.title).all()
+        }
+        for row in top_rows:
+            task_leaderboards[row.taskId]["top_agents"].append({
+                "agent_id": row.agent_id,
+                "agent_name": row.agent_name,
+                "score": row.score,
+                "time_taken": row.timeTaken,
+                "rank": row.rank
+            })
+
+        return {
+            "global_leaderboard": [
+                {
+                    "agent_id": agent.id,
+                    "agent_name": agent.name,
+                    "user_name": f"{agent.firstName} {agent.lastName or ''}".strip(),
+                    "average_score": round(agent.avg_score, 2),
+                    "total_submissions": agent.submissions,
+                    "average_time": round(agent.avg_time, 2) if agent.avg_time else 0
                 }
-            
-            return {
-                "global_leaderboard": [
-                    {
-                        "agent_id": agent.id,
-                        "agent_name": agent.name,
-                        "user_name": f"{agent.firstName} {agent.lastName or ''}".strip(),
-                        "average_score": round(agent.avg_score, 2),
-                        "total_submissions": agent.submissions,
-                        "average_time": round(agent.avg_time, 2) if agent.avg_time else 0
-                    }
-                    for agent in global_leaderboard
-                ],
-                "task_leaderboards": task_leaderboards,
-                "performance_trends": self._get_performance_trends()
-            }
-            
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Error fetching leaderboard insights: {str(e)}")
+                for agent in global_leaderboard
+            ],
+            "task_leaderboards": task_leaderboards,
+            "performance_trends": self._get_performance_trends(db)
+        }
+        
 
     # Helper methods
-    def _get_avg_completion_time(self) -> float:
-        """Calculate average completion time for all tasks"""
-        result = self.db.query(func.avg(EvaluationResult.timeTaken)).scalar()
-        return round(result, 2) if result else 0
+    def _get_user_engagement_metrics(self, db: Session, now: datetime) -> Dict[str, Any]:
+        """Calculate user engagement metrics.
+
+        ``now`` is the caller's request-scoped timestamp so the weekly-active
+        cutoff lines up with the other cutoffs in the same response.
+        """
+        # 2.0-style count: select(func.count()) emits a bare SELECT count(*)
+        # instead of Query.count()'s wrapping subquery.
+        total_users = db.execute(
+            select(func.count()).select_from(User)
+        ).scalar_one()
+        active_users = db.execute(
+            select(func.count()).select_from(User).where(
+                User.lastLoginAt >= now - timedelta(days=7)
+            )
+        ).scalar_one()
 
-    def _get_most_popular_environment(self) -> str:
-        """Get the most frequently used environment"""
-        result = self.db.query(
-            Task.webArenaEnvironment,
-            func.count(Submission.id).label('count')
-        ).join(Submission).group_by(Task.webArenaEnvironment).order_by(
-            desc('count')
-        ).first()
-        return result.webArenaEnvironment if result else "N/A"
-
-    def _get_user_engagement_metrics(self) -> Dict[str, Any]:
-        """Calculate user engagement metrics"""
-        total_users = self.db.query(User).count()
-        active_users = self.db.query(User).filter(
-            User.lastLoginAt >= datetime.utcnow() - timedelta(days=7)
-        ).count()
-        
         return {
             "weekly_active_users": active_users,
             "engagement_rate": round((active_users / total_users * 100), 2) if total_users > 0 else 0,
-            "avg_submissions_per_user": self._get_avg_submissions_per_user()
+            "avg_submissions_per_user": self._get_avg_submissions_per_user(db)
         }
 
-    def _get_avg_submissions_per_user(self) -> float:
+    def _get_avg_submissions_per_user(self, db: Session) -> float:
         """Calculate average submissions per user"""
-        result = self.db.query(
-            func.count(Submission.id) / func.count(func.distinct(Submission.userId))
+        # Cast before dividing: SQLite integer division truncates (7/3 -> 2),
+        # and NULLIF keeps an empty submissions table from dividing by zero.
+        result = db.query(
+            cast(func.count(Submission.id), Float)
+            / func.nullif(func.count(func.distinct(Submission.userId)), 0)
         ).scalar()
         return round(result, 2) if result else 0
 
-    def _get_environment_performance(self) -> Dict[str, Any]:
+    def refresh_daily_stats(self, db: Session) -> Dict[str, Any]:
+        """Recompute the daily_stats rollup; called by the background refresher."""
+        global _daily_stats
+        _daily_stats = {
+            "performance_trends": self._compute_performance_trends(db),
+            "environment_performance": self._compute_environment_performance(db),
+        }
+        return _daily_stats
+
+    def _get_environment_performance(self, db: Session) -> Dict[str, Any]:
+        """Per-environment metrics, served from the rollup when it is warm."""
+        cached = _daily_stats.get("environment_performance")
+        return cached if cached is not None else self._compute_environment_performance(db)
+
+    def _compute_environment_performance(self, db: Session) -> Dict[str, Any]:
         """Get performance metrics for each environment"""
-        environments = self.db.query(Task.webArenaEnvironment).distinct().all()
-        performance_data = {}
-        
-        for env in environments:
-            env_name = env.webArenaEnvironment
-            stats = self.db.query(
-                func.avg(EvaluationResult.score).label('avg_score'),
-                func.avg(EvaluationResult.timeTaken).label('avg_time'),
-                func.count(Submission.id).label('total_submissions')
-            ).join(Task).join(Submission).filter(
-                Task.webArenaEnvironment == env_name
-            ).first()
-            
-            performance_data[env_name] = {
-                "average_score": round(stats.avg_score, 2) if stats.avg_score else 0,
-                "average_time": round(stats.avg_time, 2) if stats.avg_time else 0,
-                "total_submissions": stats.total_submissions or 0
+        # One GROUP BY replaces a per-environment aggregation loop; the
+        # distinct-environments query only seeds zeros for environments whose
+        # tasks have no evaluated submissions yet.
+        performance_data = {
+            env.webArenaEnvironment: {
+                "average_score": 0,
+                "average_time": 0,
+                "total_submissions": 0
             }
-        
+            for env in db.query(Task.webArenaEnvironment).distinct().all()
+        }
+        rows = db.query(
+            Task.webArenaEnvironment,
+            func.avg(EvaluationResult.score).label('avg_score'),
+            func.avg(EvaluationResult.timeTaken).label('avg_time'),
+            func.count(Submission.id).label('total_submissions')
+        ).join(Submission, Submission.taskId == Task.id).join(
+            EvaluationResult, EvaluationResult.submissionId == Submission.id
+        ).group_by(Task.webArenaEnvironment).all()
+
+        for row in rows:
+            performance_data[row.webArenaEnvironment] = {
+                "average_score": round(row.avg_score, 2) if row.avg_score else 0,
+                "average_time": round(row.avg_time, 2) if row.avg_time else 0,
+                "total_submissions": row.total_submissions or 0
+            }
+
         return performance_data
 
-    def _estimate_completion_time(self, submission: Submission) -> str:
-        """Estimate completion time for active submission"""
-        # Simple estimation based on task's expected completion time
-        task = self.db.query(Task).filter(Task.id == submission.taskId).first()
-        if task:
-            elapsed = (datetime.utcnow() - submission.submittedAt).total_seconds()
-            remaining = max(0, task.expectedCompletionTime - elapsed)
+    def _estimate_completion_time(
+        self, submission: Any, expected_time: Optional[float], now: datetime
+    ) -> str:
+        """Estimate completion time for an active submission row.
+
+        ``submission`` only needs a ``submittedAt`` attribute;
+        ``expected_time`` is the task's ``expectedCompletionTime``, preloaded
+        by the caller so this helper issues no SQL of its own. ``now`` is the
+        request-scoped timestamp, so every row in one response is estimated
+        against the same instant.
+        """
+        if expected_time is not None:
+            elapsed = (now - submission.submittedAt).total_seconds()
+            remaining = max(0, expected_time - elapsed)
             return f"{int(remaining)}s"
         return "Unknown"
 
-    def _get_performance_trends(self) -> Dict[str, Any]:
+    def _get_performance_trends(self, db: Session) -> Dict[str, Any]:
+        """30-day performance trend, served from the rollup when it is warm."""
+        cached = _daily_stats.get("performance_trends")
+        return cached if cached is not None else self._compute_performance_trends(db)
+
+    def _compute_performance_trends(self, db: Session) -> Dict[str, Any]:
         """Get performance trends over time"""
-        # Last 30 days performance
+        # Last 30 days performance: one GROUP BY day instead of thirty
+        # per-day aggregate queries; quiet days are zero-filled in Python.
+        now = datetime.utcnow()
+        day = func.date(EvaluationResult.completedAt).label('day')
+        rows = db.query(
+            day,
+            func.avg(EvaluationResult.score).label('avg_score'),
+            func.count(EvaluationResult.id).label('submissions')
+        ).filter(
+            EvaluationResult.completedAt >= now - timedelta(days=30)
+        ).group_by(day).all()
+        stats_by_day = {str(row[0]): (row[1], row[2]) for row in rows}
+
         trend_data = []
         for i in range(30):
-            date = datetime.utcnow() - timedelta(days=i)
-            daily_stats = self.db.query(
-                func.avg(EvaluationResult.score).label('avg_score'),
-                func.count(EvaluationResult.id).label('submissions')
-            ).filter(
-                func.date(EvaluationResult.completedAt) == date.date()
-            ).first()
-            
+            date = now - timedelta(days=i)
+            avg_score, submissions = stats_by_day.get(date.strftime("%Y-%m-%d"), (None, 0))
             trend_data.append({
                 "date": date.strftime("%Y-%m-%d"),
-                "average_score": round(daily_stats.avg_score, 2) if daily_stats.avg_score else 0,
-                "submissions": daily_stats.submissions or 0
+                "average_score": round(avg_score, 2) if avg_score else 0,
+                "submissions": submissions or 0
             })
-        
-        return {"daily_trends": trend_data}
\ No newline at end of file
+
+        return {"daily_trends": trend_data}
+
+
+admin_controller = AdminController()
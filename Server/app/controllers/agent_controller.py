@@ -16,10 +16,7 @@ class AgentController:
         agents = self.agent_service.get_user_agents(user_id)
         return [AgentResponse.from_orm(agent) for agent in agents]
 
-    async def get_agent(self, agent_id: str, user_id: uuid.UUID) -> AgentResponse:
-        try:
-            agent_uuid = uuid.UUID(agent_id)
-            agent = self.agent_service.get_agent_by_id(agent_uuid, user_id)
-            return AgentResponse.from_orm(agent)
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid agent ID")
\ No newline at end of file
+    async def get_agent(self, agent_id: uuid.UUID, user_id: uuid.UUID) -> AgentResponse:
+        # Callers hand over an already-validated UUID, so no re-parse here.
+        agent = self.agent_service.get_agent_by_id(agent_id, user_id)
+        return AgentResponse.from_orm(agent)
\ No newline at end of file
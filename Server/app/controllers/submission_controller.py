@@ -87,9 +87,9 @@ class SubmissionController:
             "result_data": submission.result_data,
         }
     
-    async def get_leaderboard(self, task_id: uuid.UUID) -> list[LeaderboardResponse]:
+    async def get_leaderboard(self, task_id: uuid.UUID, limit: int = 50) -> list[LeaderboardResponse]:
         try:
-            leaderboard_entries = self.submission_service.get_leaderboard(task_id)
+            leaderboard_entries = self.submission_service.get_leaderboard(task_id, limit=limit)
             return leaderboard_entries
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
@@ -2,13 +2,52 @@ from fastapi import HTTPException
 from ..services.task_service import TaskService
 from ..schemas.task_schema import TaskCreate, TaskUpdate, TaskResponse, TaskListResponse
 from sqlalchemy.orm import Session
+import re
 import uuid
 
+# Canonical hyphenated or bare-hex UUID. Matching first means a malformed id
+# costs one regex test instead of uuid.UUID's pure-Python parse plus an
+# exception unwind — and every task detail/update/delete hits this check.
+_UUID_RE = re.compile(
+    r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$"
+    r"|^[0-9a-f]{32}$",
+    re.I,
+)
+
+
+def _parse_uuid(value: str) -> uuid.UUID:
+    """Validate and parse a task id, raising 400 on malformed input."""
+    if not _UUID_RE.match(value):
+        raise HTTPException(status_code=400, detail="Invalid task ID format")
+    return uuid.UUID(value)
+
+def _task_row(task) -> dict:
+    """Plain dict for one task row, shaped like ``TaskResponse``.
+
+    The list endpoint hands these straight to the app-wide ORJSONResponse
+    (orjson handles datetimes and str-enums natively), skipping per-row
+    pydantic model construction and the jsonable_encoder pass.
+    """
+    return {
+        "id": task.id,
+        "title": task.title,
+        "description": task.description,
+        "difficulty": task.difficulty,
+        "webArenaEnvironment": task.webArenaEnvironment,
+        "environmentConfig": task.environmentConfig,
+        "createdAt": task.createdAt,
+        "updatedAt": task.updatedAt,
+        "webArenaTaskId": task.webArenaTaskId,
+        "webArenaTaskConfigPath": task.webArenaTaskConfigPath,
+        "webArenaInstructionPath": task.webArenaInstructionPath,
+    }
+
+
 class TaskController:
     def __init__(self, db: Session):
         self.task_service = TaskService(db)
 
-    async def create_task(self, task_data: TaskCreate, creator_id: uuid.UUID) -> TaskResponse:
+    def create_task(self, task_data: TaskCreate, creator_id: uuid.UUID) -> TaskResponse:
         task = self.task_service.create_task(task_data.dict(), creator_id)
         # Build simplified response matching tests
         return {
@@ -21,35 +60,31 @@ class TaskController:
             "task_config": task.environmentConfig,
         }
 
-    async def get_tasks(self, skip: int = 0, limit: int = 10) -> TaskListResponse:
-        tasks = self.task_service.get_tasks(skip, limit)
-        total = len(tasks)
-        return TaskListResponse(
-            items=[TaskResponse.from_orm(task) for task in tasks],
-            total=total,
-            page=skip // limit + 1,
-            size=limit
-        )
-
-    async def get_task(self, task_id: str) -> TaskResponse:
-        try:
-            task_uuid = uuid.UUID(task_id)
-            task = self.task_service.get_task_by_id(task_uuid)
-            return TaskResponse.from_orm(task)
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid task ID format")
-
-    async def update_task(self, task_id: str, task_data: TaskUpdate) -> TaskResponse:
-        try:
-            task_uuid = uuid.UUID(task_id)
-            task = self.task_service.update_task(task_uuid, task_data.dict(exclude_unset=True))
-            return TaskResponse.from_orm(task)
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid task ID format")
-
-    async def delete_task(self, task_id: str) -> None:
-        try:
-            task_uuid = uuid.UUID(task_id)
-            self.task_service.delete_task(task_uuid)
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid task ID format")
\ No newline at end of file
+    def get_tasks(self, skip: int = 0, limit: int = 10) -> dict:
+        # Plain dicts all the way out: no TaskResponse per row and no
+        # TaskListResponse wrapper, so the only serialization work left is
+        # orjson itself (and the payload stays codable for the route cache).
+        tasks, total = self.task_service.get_tasks_page(skip, limit)
+        return {
+            "items": [_task_row(task) for task in tasks],
+            "total": total,
+            "page": skip // limit + 1,
+            "size": limit,
+        }
+
+    def get_task(self, task_id: str) -> TaskResponse:
+        task_uuid = _parse_uuid(task_id)
+        task = self.task_service.get_task_by_id(task_uuid)
+        # model_construct: the row came straight from our own database,
+        # so re-running every field validator (as from_orm does) buys
+        # nothing on this trusted path.
+        return TaskResponse.model_construct(**_task_row(task))
+
+    def update_task(self, task_id: str, task_data: TaskUpdate) -> TaskResponse:
+        task_uuid = _parse_uuid(task_id)
+        task = self.task_service.update_task(task_uuid, task_data.dict(exclude_unset=True))
+        return TaskResponse.model_construct(**_task_row(task))
+
+    def delete_task(self, task_id: str) -> None:
+        task_uuid = _parse_uuid(task_id)
+        self.task_service.delete_task(task_uuid)
\ No newline at end of file
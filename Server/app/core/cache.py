@@ -0,0 +1,114 @@
+"""Response-cache setup and key builders for hot read endpoints.
+
+Built on fastapi-cache2. The backend is Redis when ``REDIS_URL`` is
+configured (shared across workers) and an in-process backend otherwise, so
+development and tests need no extra infrastructure.
+
+Key builders deliberately never embed raw user identifiers: admin-wide
+analytics hash the caller's *role* so every admin shares one entry, and
+per-user endpoints hash the user id so keys carry no PII.
+"""
+
+import hashlib
+from typing import Any, Callable, Optional
+
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+
+from .config import settings
+
+CACHE_PREFIX = "agentarena-cache"
+
+
+def init_response_cache() -> None:
+    """Initialize the shared response cache; called once at app creation."""
+    if settings.REDIS_URL:
+        from redis import asyncio as aioredis
+        from fastapi_cache.backends.redis import RedisBackend
+
+        backend = RedisBackend(aioredis.from_url(settings.REDIS_URL))
+    else:
+        backend = InMemoryBackend()
+    FastAPICache.init(backend, prefix=CACHE_PREFIX)
+
+
+def _digest(value: str) -> str:
+    return hashlib.blake2b(value.encode(), digest_size=16).hexdigest()
+
+
+def admin_shared_key_builder(
+    func: Callable,
+    namespace: Optional[str] = "",
+    request: Any = None,
+    response: Any = None,
+    args: Optional[tuple] = None,
+    kwargs: Optional[dict] = None,
+) -> str:
+    """One cache entry per endpoint per role — all admins share it."""
+    user = (kwargs or {}).get("current_user")
+    role = getattr(getattr(user, "role", None), "value", "anonymous")
+    return f"{CACHE_PREFIX}:{namespace}:{func.__module__}.{func.__name__}:{_digest(role)}"
+
+
+def per_user_key_builder(
+    func: Callable,
+    namespace: Optional[str] = "",
+    request: Any = None,
+    response: Any = None,
+    args: Optional[tuple] = None,
+    kwargs: Optional[dict] = None,
+) -> str:
+    """One cache entry per endpoint per user, keyed by a hashed user id."""
+    user = (kwargs or {}).get("current_user")
+    user_id = str(getattr(user, "id", "anonymous"))
+    return f"{CACHE_PREFIX}:{namespace}:{func.__module__}.{func.__name__}:{_digest(user_id)}"
+
+
+def _request_digest(request: Any) -> str:
+    """Hash of the request path plus its (order-insensitive) query string."""
+    path = request.url.path if request is not None else ""
+    query = "&".join(
+        f"{k}={v}" for k, v in sorted(request.query_params.multi_items())
+    ) if request is not None else ""
+    return _digest(f"{path}?{query}")
+
+
+def public_request_key_builder(
+    func: Callable,
+    namespace: Optional[str] = "",
+    request: Any = None,
+    response: Any = None,
+    args: Optional[tuple] = None,
+    kwargs: Optional[dict] = None,
+) -> str:
+    """Shared cache entry per URL (path + query) — same for every caller.
+
+    For read-mostly public data (task catalog, leaderboards) where the
+    response does not depend on who is asking.
+    """
+    return f"{CACHE_PREFIX}:{namespace}:{_request_digest(request)}"
+
+
+def per_user_request_key_builder(
+    func: Callable,
+    namespace: Optional[str] = "",
+    request: Any = None,
+    response: Any = None,
+    args: Optional[tuple] = None,
+    kwargs: Optional[dict] = None,
+) -> str:
+    """Cache entry per URL *and* per user, for user-scoped listings."""
+    user = (kwargs or {}).get("current_user")
+    user_id = str(getattr(user, "id", "anonymous"))
+    return (
+        f"{CACHE_PREFIX}:{namespace}:{_request_digest(request)}:{_digest(user_id)}"
+    )
+
+
+async def invalidate_namespace(namespace: str) -> None:
+    """Drop every cached response in ``namespace`` after a write.
+
+    Write endpoints call this so readers never serve stale data for longer
+    than one request, regardless of the namespace's TTL.
+    """
+    await FastAPICache.clear(namespace=namespace)
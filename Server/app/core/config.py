@@ -3,7 +3,7 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import List, Optional, Any, Dict
 from pathlib import Path
 import os
-from functools import lru_cache
+from functools import cached_property, lru_cache
 
 
 class Settings(BaseSettings):
@@ -25,6 +25,8 @@ class Settings(BaseSettings):
         description="Database connection URL"
     )
     DATABASE_LOGGING: bool = Field(default=False, description="Enable database query logging")
+    DB_POOL_SIZE: int = Field(default=20, description="Connections kept open in the pool (PostgreSQL)")
+    DB_MAX_OVERFLOW: int = Field(default=10, description="Extra connections allowed beyond the pool size under burst load")
     
     # JWT settings
     JWT_SECRET_KEY: str = Field(
@@ -41,10 +43,10 @@ class Settings(BaseSettings):
         description="Comma-separated list of allowed origins"
     )
     
-    @property
-    def CORS_ORIGINS_LIST(self) -> List[str]:
-        """Get CORS origins as a list."""
-        return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
+    @cached_property
+    def CORS_ORIGINS_LIST(self) -> tuple:
+        """CORS origins, split once and cached as an immutable tuple."""
+        return tuple(origin.strip() for origin in self.CORS_ORIGINS.split(","))
     
     # Logging settings
     LOG_LEVEL: str = Field(default="INFO", description="Logging level")
@@ -66,6 +68,28 @@ class Settings(BaseSettings):
     
     # Redis settings (for future use)
     REDIS_URL: Optional[str] = Field(default=None, description="Redis connection URL")
+
+    # Cache tuning
+    USER_STATS_CACHE_TTL: int = Field(
+        default=60,
+        description="Seconds a user's precomputed submission aggregates stay cached",
+    )
+    TASK_CACHE_TTL: int = Field(
+        default=300,
+        description="Seconds task lists/details stay cached (tasks change rarely)",
+    )
+    LEADERBOARD_CACHE_TTL: int = Field(
+        default=60,
+        description="Seconds leaderboard responses stay cached",
+    )
+    AGENT_LIST_CACHE_TTL: int = Field(
+        default=60,
+        description="Seconds a user's agent list stays cached",
+    )
+    ADMIN_ANALYTICS_CACHE_TTL: int = Field(
+        default=30,
+        description="Seconds admin dashboard/analytics aggregates stay cached",
+    )
     
     # File storage settings
     UPLOAD_DIR: str = Field(default="uploads", description="Directory for file uploads")
@@ -109,14 +133,24 @@ class Settings(BaseSettings):
         return v.upper()
     
     def get_database_config(self) -> Dict[str, Any]:
-        """Get database configuration."""
+        """Get database configuration.
+
+        Single source of truth for the engine's pool knobs — the engine in
+        ``db/database.py`` consumes this instead of hardcoding its own copy.
+        """
+        return self._database_config
+
+    # cached_property rather than lru_cache on the method: pydantic models
+    # are not hashable, so a bound-method lru_cache would raise on call.
+    @cached_property
+    def _database_config(self) -> Dict[str, Any]:
         return {
             "url": self.DATABASE_URL,
-            "echo": self.DEBUG,
-            "pool_size": 20,
-            "max_overflow": 30,
+            "echo": self.DATABASE_LOGGING,
+            "pool_size": self.DB_POOL_SIZE,
+            "max_overflow": self.DB_MAX_OVERFLOW,
             "pool_pre_ping": True,
-            "pool_recycle": 3600,
+            "pool_recycle": 300,
         }
     
     model_config = SettingsConfigDict(
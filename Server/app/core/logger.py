@@ -1,5 +1,7 @@
 import logging
 import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 from loguru import logger as loguru_logger
 import sys
@@ -18,14 +20,15 @@ class Logger:
         # Configure loguru
         loguru_logger.remove()  # Remove default handler
         
-        # Console handler
+        # Console handler; enqueue moves formatting/IO to a background thread
         loguru_logger.add(
             sys.stdout,
             level=log_level,
             format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-            colorize=True
+            colorize=True,
+            enqueue=True
         )
-        
+
         # File handler if specified
         if log_file:
             loguru_logger.add(
@@ -34,11 +37,24 @@ class Logger:
                 format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
                 rotation="10 MB",
                 retention="1 week",
-                compression="zip"
+                compression="zip",
+                enqueue=True
             )
         
         cls._configured = True
 
+# Shared queue + listener for every stdlib logger handed out below: emitters
+# only enqueue records, and one background thread does the formatting and the
+# write syscalls, keeping log calls cheap inside request handlers.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_console_handler = logging.StreamHandler()
+_console_handler.setFormatter(
+    logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+)
+_queue_listener = QueueListener(_log_queue, _console_handler, respect_handler_level=True)
+_queue_listener.start()
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance for the given name."""
     logger = logging.getLogger(name)
@@ -46,13 +62,7 @@ def get_logger(name: str) -> logging.Logger:
 
     # Prevent adding multiple handlers if logger is already configured
     if not logger.handlers:
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        )
-
-        console_handler = logging.StreamHandler()
-        console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        logger.addHandler(QueueHandler(_log_queue))
 
     return logger
 
@@ -1,6 +1,6 @@
 from typing import Generic, TypeVar, List, Optional
 from pydantic import BaseModel, field_validator
-from math import ceil
+from sqlalchemy import func
 
 T = TypeVar('T')
 
@@ -68,9 +68,12 @@ class PaginatedResponse(BaseModel, Generic[T]):
         size: int
     ) -> "PaginatedResponse[T]":
         """Create a paginated response."""
-        pages = ceil(total / size) if size > 0 else 0
-        
-        return cls(
+        # Ceiling division in integers — no float round-trip through
+        # math.ceil — and model_construct since every value here is
+        # computed by us, so validators have nothing to check.
+        pages = 0 if size <= 0 else (total + size - 1) // size
+
+        return cls.model_construct(
             items=items,
             total=total,
             page=page,
@@ -87,14 +90,42 @@ class PaginatedResponse(BaseModel, Generic[T]):
 
 
 def paginate_query(query, params: "PaginationParams") -> PaginatedResponse:
-    """Paginate a SQLAlchemy query and return a PaginatedResponse instance."""
+    """Paginate a SQLAlchemy query and return a PaginatedResponse instance.
+
+    On PostgreSQL the total rides along on the page itself as a
+    ``count(*) OVER ()`` window column, so one round trip returns both the
+    items and the total and the planner reuses the same index scan. Other
+    dialects keep the two-query COUNT-then-fetch path.
+    """
 
     offset = params.offset
     limit = params.limit
 
-    total = query.count()
-    items = query.offset(offset).limit(limit).all()
-    
+    dialect = getattr(
+        getattr(getattr(query, "session", None), "bind", None), "dialect", None
+    )
+    if getattr(dialect, "name", None) == "postgresql":
+        rows = (
+            query.add_columns(func.count().over().label("_total"))
+            .offset(offset)
+            .limit(limit)
+            .all()
+        )
+        if rows:
+            total = rows[0][-1]
+            items = [row[0] for row in rows]
+        elif offset:
+            # Past-the-end page: the window never ran, so fall back to a
+            # plain COUNT for the total.
+            total = query.order_by(None).count()
+            items = []
+        else:
+            total = 0
+            items = []
+    else:
+        total = query.count()
+        items = query.offset(offset).limit(limit).all()
+
     return PaginatedResponse.create(
         items=items,
         total=total,
@@ -1,7 +1,13 @@
+import hashlib
+import threading
+import time
+
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
-from sqlalchemy.orm import Session
+from loguru import logger
+from sqlalchemy.orm import Session, load_only
 from ..models.user import User
 from ..models.enums import UserRole
 from ..db.database import get_db
@@ -10,6 +16,45 @@ from uuid import UUID
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/v1/auth/login")
 
+# token-digest -> (user_id, exp). Repeated requests with the same bearer
+# token skip the HMAC verification in jwt.decode; entries expire with the
+# cache TTL or the token's own "exp", whichever comes first. Only the id is
+# cached — the User row still loads through the request's session, so role
+# or deactivation changes are picked up on the next request.
+_TOKEN_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+_TOKEN_CACHE_LOCK = threading.Lock()
+
+
+def _token_user_id(token: str) -> str:
+    """Resolve a bearer token to its subject, memoizing valid tokens."""
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    try:
+        with _TOKEN_CACHE_LOCK:
+            user_id, exp = _TOKEN_CACHE[key]
+        if exp > time.time():
+            return user_id
+    except KeyError:
+        pass
+    payload = jwt.decode(
+        token,
+        settings.JWT_SECRET_KEY,
+        algorithms=[settings.JWT_ALGORITHM]
+    )
+    user_id = payload.get("sub")
+    exp = payload.get("exp")
+    if user_id and exp is not None:
+        with _TOKEN_CACHE_LOCK:
+            _TOKEN_CACHE[key] = (user_id, exp)
+    return user_id
+
+# Every column the auth path and its handlers actually read; the rest
+# (password hash, timestamps, counters) stay deferred so the per-request
+# row-fetch moves the minimum bytes. Extending handler access to other
+# columns means extending this list, or that access lazy-loads.
+_AUTH_COLUMNS = load_only(
+    User.id, User.username, User.email, User.role, User.isActive
+)
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db)
@@ -20,31 +65,27 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(
-            token, 
-            settings.JWT_SECRET_KEY, 
-            algorithms=[settings.JWT_ALGORITHM]
-        )
-        user_id = payload.get("sub")
+        user_id = _token_user_id(token)
 
         if not user_id:
             raise credentials_exception
 
-        print("Token Payload:", payload)
-
-    
-        # Use string-based UUIDs for database queries to ensure compatibility with SQLite
-        user = db.query(User).filter(User.id == str(user_id)).first()
+        # Session.get() short-circuits through the identity map for PK
+        # lookups, skipping the SELECT entirely when the user is already
+        # loaded in this session. String-based UUIDs keep SQLite compatible.
+        user = db.get(User, str(user_id), options=[_AUTH_COLUMNS])
         if not user:
             raise credentials_exception
         
         return user
 
     except JWTError as e:
-        print("JWT Error:", str(e))
+        # Debug level, not print: invalid tokens are routine traffic and a
+        # synchronous stdout flush per rejected request is pure overhead.
+        logger.debug(f"JWT rejected: {e}")
         raise credentials_exception
     except Exception as e:
-        print("Unexpected Error:", str(e))
+        logger.warning(f"Unexpected auth error: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(e)
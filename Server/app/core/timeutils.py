@@ -0,0 +1,34 @@
+"""Shared timestamp helpers.
+
+``datetime.utcnow()`` is deprecated and every route/broadcast payload was
+formatting its own copy of the current time. Routes that embed the same
+timestamp in several fields should call :func:`now_iso` once and reuse the
+string.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+
+
+def now_iso() -> str:
+    """Current UTC time as an ISO-8601 string (timezone-aware)."""
+    return datetime.now(timezone.utc).isoformat()
+
+
+# Tick-updated timestamp for hot endpoints that can tolerate one second of
+# staleness (health probes, status payloads): reading a module string beats
+# a clock syscall plus isoformat() on every request.
+_cached_now_iso = now_iso()
+
+
+def cached_now_iso() -> str:
+    """Last tick's UTC timestamp; at most ~1s stale once the clock task runs."""
+    return _cached_now_iso
+
+
+async def tick_clock(interval: float = 1.0) -> None:
+    """Refresh the cached timestamp; launched once at app startup."""
+    global _cached_now_iso
+    while True:
+        _cached_now_iso = now_iso()
+        await asyncio.sleep(interval)
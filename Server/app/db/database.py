@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine, inspect, text
+from sqlalchemy import create_engine, event, inspect, text
 from sqlalchemy.orm import sessionmaker
 from ..core.config import settings
 from ..models.base import Base
@@ -8,32 +8,69 @@ import os
 DATABASE_URL = settings.DATABASE_URL
 
 # Create engine based on database type
+# Raised from the 500-statement default so hot per-request statements (auth
+# lookup, leaderboards, admin aggregates) never evict each other from the
+# compiled-SQL cache and each is compiled once per process.
+_QUERY_CACHE_SIZE = 1200
+
 if DATABASE_URL.startswith("postgresql"):
+    _db_config = settings.get_database_config()
     engine = create_engine(
-        DATABASE_URL,
-        echo=settings.DATABASE_LOGGING,
-        pool_pre_ping=True,
-        pool_recycle=300,
+        _db_config["url"],
+        echo=_db_config["echo"],
+        pool_pre_ping=_db_config["pool_pre_ping"],
+        pool_recycle=_db_config["pool_recycle"],
+        pool_size=_db_config["pool_size"],
+        max_overflow=_db_config["max_overflow"],
+        # LIFO checkout hands back the most recently returned connection,
+        # so under light load the same warm connection keeps being reused.
+        pool_use_lifo=True,
+        query_cache_size=_QUERY_CACHE_SIZE,
     )
 else:
     # SQLite for development
     engine = create_engine(
         DATABASE_URL,
         echo=settings.DATABASE_LOGGING,
-        connect_args={"check_same_thread": False}
+        connect_args={"check_same_thread": False},
+        query_cache_size=_QUERY_CACHE_SIZE,
     )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Run per-connection PRAGMAs once, when the pool opens a connection.
 
-# Ensure all Session objects keep attributes loaded after commit (helps tests)
-from sqlalchemy.orm import Session as _BaseSession
-_BaseSession.expire_on_commit = False
+        Pooled connections are reused across requests, so WAL mode and the
+        relaxed sync level are not re-negotiated per request.
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+# expire_on_commit=False belongs here, on our sessionmaker, not patched
+# onto the Session class: handlers read attributes after commit without a
+# refresh round trip, and third-party sessions keep stock semantics.
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
 
 def get_db():
-    """Dependency for getting database session"""
+    """Dependency for getting database session.
+
+    Generator teardown runs after the response is sent (the pinned FastAPI
+    release has no per-dependency ``scope=`` knob), so teardown is kept to
+    the bare minimum that returns the connection to the pool quickly: roll
+    back any transaction a handler left open, then close. Anything slower
+    (warmup, logging) belongs in the services, not here.
+    """
     db = SessionLocal()
     try:
         yield db
+    except Exception:
+        db.rollback()
+        raise
     finally:
         db.close()
 
@@ -33,7 +33,7 @@ class Agent(Base):
     llmApiKey = Column(String, nullable=True)  # Encrypted LLM API key
     agentType = Column(String, default="gpt-4")  # Agent type for WebArena
     
-    createdAt = Column(DateTime(timezone=True), server_default=func.now())
+    createdAt = Column(DateTime(timezone=True), server_default=func.now(), index=True)  # recent-agents ordering
     updatedAt = Column(DateTime(timezone=True), onupdate=func.now())
     isActive = Column(Boolean, default=True)
     
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Enum, ForeignKey, DateTime, Boolean, Float, JSON
+from sqlalchemy import Column, Index, String, Enum, ForeignKey, DateTime, Boolean, Float, JSON
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import uuid
@@ -8,13 +8,21 @@ from .base import Base
 
 class EvaluationResult(Base):
     __tablename__ = "evaluation_results"
-    
+
+    # Joins from submissions plus score/time aggregates all enter through
+    # submissionId; indexing score alongside lets leaderboard-style
+    # "best score per submission" lookups stay on the index.
+    __table_args__ = (
+        Index("ix_evaluation_results_submission_score", "submissionId", "score"),
+    )
+
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     submissionId = Column(String(36), ForeignKey("submissions.id"))
     score = Column(Float)
     timeTaken = Column(Float)
     accuracy = Column(Float)
-    completedAt = Column(DateTime(timezone=True))
+    # Indexed for the admin performance-trend GROUP BY over the last 30 days
+    completedAt = Column(DateTime(timezone=True), index=True)
     resultDetails = Column(JSON)
     status = Column(Enum(EvaluationStatus))
     
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, ForeignKey, DateTime, Boolean, Integer, Float
+from sqlalchemy import Column, Index, String, ForeignKey, DateTime, Boolean, Integer, Float
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import uuid
@@ -7,7 +7,13 @@ from .base import Base
 
 class Leaderboard(Base):
     __tablename__ = "leaderboard"
-    
+
+    # Leaderboard reads are always "entries for one task ordered by rank";
+    # the composite index serves both the filter and the sort.
+    __table_args__ = (
+        Index("ix_leaderboard_task_rank", "taskId", "rank"),
+    )
+
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     taskId = Column(String(36), ForeignKey("tasks.id"))
     agentId = Column(String(36), ForeignKey("agents.id"))
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Enum, ForeignKey, DateTime, Boolean, Integer, Float, Text, JSON
+from sqlalchemy import Column, Index, String, Enum, ForeignKey, DateTime, Boolean, Integer, Float, Text, JSON
 from sqlalchemy.orm import relationship, synonym
 from sqlalchemy.sql import func
 import uuid
@@ -8,15 +8,26 @@ from .base import Base
 
 class Submission(Base):
     __tablename__ = "submissions"
-    
+
+    # Analytics filters on (userId, status); the per-task listing filters on
+    # (userId, taskId). Composite indexes keep both off full scans.
+    __table_args__ = (
+        Index("ix_submissions_user_status", "userId", "status"),
+        Index("ix_submissions_user_task", "userId", "taskId"),
+        # Real-time monitoring filters on status plus a submittedAt cutoff.
+        Index("ix_submissions_status_submitted", "status", "submittedAt"),
+    )
+
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     userId = Column(String(36), ForeignKey("users.id"))
     agentId = Column(String(36), ForeignKey("agents.id"))
     taskId = Column(String(36), ForeignKey("tasks.id"))
-    status = Column(String)  # Using string instead of enum for simplicity
-    submittedAt = Column(DateTime(timezone=True), server_default=func.now())
+    # Indexed: admin status counters and queue-length checks filter on it.
+    status = Column(String, index=True)  # Using string instead of enum for simplicity
+    # Indexed: every dashboard orders recent activity by these columns.
+    submittedAt = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     updatedAt = Column(DateTime(timezone=True), onupdate=func.now())
-    createdAt = Column(DateTime(timezone=True), server_default=func.now())  # Added for consistency
+    createdAt = Column(DateTime(timezone=True), server_default=func.now(), index=True)  # Added for consistency
     
     # Execution tracking fields
     runConfig = Column(JSON, nullable=True)  # Configuration used for the run
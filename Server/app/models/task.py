@@ -26,7 +26,8 @@ class Task(Base):
     title = Column(String)
     description = Column(String)
     difficulty = Column(Enum(TaskDifficulty))
-    webArenaEnvironment = Column(String)
+    # Indexed: environment usage/performance analytics group and filter on it
+    webArenaEnvironment = Column(String, index=True)
     environmentConfig = Column(JSON)
     
     # WebArena-specific fields
@@ -10,15 +10,22 @@ class User(Base):
     __tablename__ = "users"
     
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    # username/email are the login-lookup columns (AuthService filters on
+    # either); they must stay unique+indexed so auth remains an index scan.
     username = Column(String, unique=True, index=True, nullable=True)
     email = Column(String, unique=True, index=True)
     firstName = Column(String)
     lastName = Column(String, nullable=True)
     password = Column(String)
     role = Column(Enum(UserRole))
-    createdAt = Column(DateTime(timezone=True), server_default=func.now())
+    # Denormalized from role so the admin gate reads one indexed boolean
+    # instead of chasing the enum; kept in sync wherever role is written.
+    isAdmin = Column(Boolean, default=False, index=True)
+    # Indexed for the admin registration-trend GROUP BY over the last 30 days
+    createdAt = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     updatedAt = Column(DateTime(timezone=True), onupdate=func.now())
-    lastLoginAt = Column(DateTime(timezone=True), nullable=True)
+    # Indexed for the weekly-active-users engagement cutoff
+    lastLoginAt = Column(DateTime(timezone=True), nullable=True, index=True)
     isActive = Column(Boolean, default=True)
     isEmailVerified = Column(Boolean, default=False)
     loginCount = Column(Integer, default=0)
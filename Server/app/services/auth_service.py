@@ -12,6 +12,12 @@ from ..models.enums import UserRole
 import uuid
 from sqlalchemy.exc import IntegrityError
 
+# One process-wide context: CryptContext setup (scheme resolution, bcrypt
+# backend load) is not free, and AuthService is built per request — every
+# instance shares this instead of paying that cost again.
+_PASSWORD_CONTEXT = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
 class AuthService:
     """Authentication utilities.
 
@@ -24,7 +30,7 @@ class AuthService:
 
     def __init__(self, db: Session | None = None):
         self._db = db
-        self._password_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        self._password_context = _PASSWORD_CONTEXT
 
     # -------------------------------------------------------------------------
     # Password helpers (public)
@@ -114,13 +120,15 @@ class AuthService:
         # ------------------------------------------------------------------
         # Persist new user
         # ------------------------------------------------------------------
+        role = user_data.get("role", UserRole.USER)
         new_user = User(
             username=username,
             email=user_data["email"],
             password=self._get_hashed_password(user_data["password"]),
             firstName=user_data.get("firstName"),
             lastName=user_data.get("lastName"),
-            role=user_data.get("role", UserRole.USER),
+            role=role,
+            isAdmin=(role == UserRole.ADMIN),
         )
             
         self._db.add(new_user)
@@ -24,16 +24,36 @@ class PlaygroundServiceFactory:
     based on configuration and environment availability.
     """
     
-    @staticmethod
-    async def create_service() -> IPlaygroundExecutionService:
+    # Process-scoped instance: both services are stateless, so callers
+    # (health probes, submissions) share one instead of rebuilding and
+    # re-health-checking the service per request.
+    _instance: Optional[IPlaygroundExecutionService] = None
+
+    @classmethod
+    async def create_service(cls) -> IPlaygroundExecutionService:
         """Create and return the appropriate playground execution service.
-        
+
+        The first call resolves and caches the service; later calls return
+        the cached instance. Use :meth:`reset` to force re-resolution.
+
         Returns:
             IPlaygroundExecutionService: The playground execution service to use
-            
+
         Raises:
             ConfigurationException: If there's an issue with the configuration
         """
+        if cls._instance is not None:
+            return cls._instance
+        cls._instance = await cls._resolve_service()
+        return cls._instance
+
+    @classmethod
+    def reset(cls) -> None:
+        """Drop the cached service so the next call re-resolves it."""
+        cls._instance = None
+
+    @staticmethod
+    async def _resolve_service() -> IPlaygroundExecutionService:
         try:
             # Check if real playground is enabled in settings
             use_real_playground = settings.USE_REAL_PLAYGROUND
@@ -1,6 +1,6 @@
 from typing import Dict, Any, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import desc, func
 from loguru import logger
 
 from ..models.user import User
@@ -35,8 +35,10 @@ class SubmissionService:
         else:
             self._playground_executor = db_or_playground_executor
             self._db = None  # db will be supplied per-call
-        
-        logger.info(
+
+        # Debug, not info: this constructor runs once per request, and a
+        # formatted log line per construction is measurable noise at volume.
+        logger.debug(
             f"Initialized SubmissionService with playground executor: {type(self._playground_executor).__name__ if self._playground_executor else 'None'}"
         )
 
@@ -175,7 +177,14 @@ class SubmissionService:
             Paginated response with submissions
         """
         try:
-            query = db.query(Submission).filter(Submission.userId == user_id).order_by(desc(Submission.createdAt))
+            # Eager-load the 1:1 evaluation in one extra IN query so callers
+            # touching submission.evaluation never lazy-load per row (N+1).
+            query = (
+                db.query(Submission)
+                .options(selectinload(Submission.evaluation))
+                .filter(Submission.userId == user_id)
+                .order_by(desc(Submission.createdAt))
+            )
             
             if pagination is None:
                 pagination = PaginationParams()
@@ -259,23 +268,49 @@ class SubmissionService:
         return "Not implemented"
 
     # Alias used by SubmissionController
+    def _windowed_page(self, db: Session, *criteria, skip: int = 0, limit: int = 20) -> Dict[str, Any]:
+        """Fetch one page of submissions plus the filtered total in one query.
+
+        ``count() OVER ()`` repeats the total on every returned row, so the
+        page and its total cost a single round-trip instead of a separate
+        COUNT plus SELECT.
+        """
+        rows = (
+            db.query(Submission, func.count().over().label("total"))
+            .options(selectinload(Submission.evaluation))
+            .filter(*criteria)
+            .order_by(desc(Submission.createdAt))
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+        if rows:
+            total = rows[0][1]
+        elif skip:
+            # Past-the-end page: the window returned nothing, so the total
+            # needs its own count.
+            total = db.query(func.count(Submission.id)).filter(*criteria).scalar() or 0
+        else:
+            total = 0
+        return {"items": [row[0] for row in rows], "total": total}
+
     def get_user_submissions(self, user_id, skip=0, limit=20):
-        pagination = PaginationParams(page=skip // limit + 1, size=limit)
         if self._db is None:
             raise RuntimeError("SubmissionService instance lacks a database session for get_user_submissions")
-        paginated = self.get_submissions_by_user(self._db, user_id, pagination)
-        return {"items": paginated.items, "total": paginated.total}
+        return self._windowed_page(
+            self._db, Submission.userId == str(user_id), skip=skip, limit=limit
+        )
 
     def get_user_submissions_by_task(self, user_id, task_id, skip=0, limit=20):
         if self._db is None:
             raise RuntimeError("SubmissionService instance lacks a database session for get_user_submissions_by_task")
-        db = self._db
-        pagination = PaginationParams(page=skip // limit + 1, size=limit)
-        query = db.query(Submission).filter(
-            Submission.userId == str(user_id), Submission.taskId == str(task_id)
+        return self._windowed_page(
+            self._db,
+            Submission.userId == str(user_id),
+            Submission.taskId == str(task_id),
+            skip=skip,
+            limit=limit,
         )
-        paginated = paginate_query(query, pagination)
-        return {"items": paginated.items, "total": paginated.total}
 
     def _get_full_submission(self, submission_id):
         db = self._db or Session.object_session
@@ -287,15 +322,16 @@ class SubmissionService:
         logger.info(f"Mock process_submission called for {submission_id} (task {task_id})")
 
     # Add rubric-based leaderboard generation method
-    def get_leaderboard(self, task_id):
+    def get_leaderboard(self, task_id, limit: int = 50):
         """Generate a rubric-based leaderboard for a task.
-        
+
         This method implements a structured rubric-based approach for evaluating
         agent performance on tasks, especially for mock analysis scenarios.
-        
+
         Args:
             task_id: ID of the task
-            
+            limit: Maximum number of entries to return (top-N by final score)
+
         Returns:
             List of leaderboard entries with detailed metrics
         """
@@ -425,11 +461,15 @@ class SubmissionService:
             
             leaderboard_entries.append(entry)
         
-        # Sort by score (descending) and update ranks
+        # Sort by score (descending), keep the top-N, and update ranks.
+        # Final scores come out of the rubric above (not a column), so the
+        # cap is applied here rather than as a SQL LIMIT — limiting the
+        # submission fetch would drop candidates before scoring.
         leaderboard_entries.sort(key=lambda x: x["score"], reverse=True)
+        del leaderboard_entries[limit:]
         for idx, entry in enumerate(leaderboard_entries):
             entry["rank"] = idx + 1
-        
+
         logger.info(f"Generated leaderboard for task {task_id} with {len(leaderboard_entries)} entries")
         return leaderboard_entries
 
@@ -1,6 +1,7 @@
 from fastapi import HTTPException
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlalchemy import func
+from sqlalchemy.orm import Session, selectinload
+from typing import List, Optional, Tuple
 from ..models.task import Task
 from ..models.enums import TaskDifficulty
 import uuid
@@ -43,8 +44,41 @@ class TaskService:
             self._db.rollback()
             raise HTTPException(status_code=500, detail=str(e))
 
-    def get_tasks(self, skip: int = 0, limit: int = 10) -> List[Task]:
-        return self._db.query(Task).offset(skip).limit(limit).all()
+    def get_tasks(self, skip: int = 0, limit: int = 10, eager: Tuple[str, ...] = ()) -> List[Task]:
+        """Return a page of tasks.
+
+        ``eager`` names relationships ("metrics", "creator", ...) to batch-load
+        via ``selectinload`` — one IN query per relationship instead of a lazy
+        SELECT per row. The list endpoint serializes plain columns only, so it
+        passes nothing here; callers that walk relations must, or they pay the
+        classic N+1.
+        """
+        query = self._db.query(Task)
+        for rel in eager:
+            query = query.options(selectinload(getattr(Task, rel)))
+        return query.offset(skip).limit(limit).all()
+
+    def get_tasks_page(
+        self, skip: int = 0, limit: int = 10, eager: Tuple[str, ...] = ()
+    ) -> Tuple[List[Task], int]:
+        """Return a page of tasks plus the true table total.
+
+        The total rides along as a ``count(*) OVER ()`` window column on the
+        page rows, so items and total come back in one round trip instead of
+        a separate COUNT query.
+        """
+        query = self._db.query(Task, func.count().over().label("total"))
+        for rel in eager:
+            query = query.options(selectinload(getattr(Task, rel)))
+        rows = query.offset(skip).limit(limit).all()
+        if rows:
+            total = rows[0][1]
+        elif skip:
+            # Page past the end: no rows carried the window value back.
+            total = self._db.query(func.count(Task.id)).scalar() or 0
+        else:
+            total = 0
+        return [row[0] for row in rows], total
 
     def get_task_by_id(self, task_id: uuid.UUID | str) -> Task:
         task = self._db.query(Task).filter(Task.id == str(task_id)).first()
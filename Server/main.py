@@ -1,6 +1,9 @@
+import asyncio
+import uuid
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from app.core.config import settings
@@ -13,6 +16,8 @@ from app.core.exceptions import (
     PlaygroundExecutionException,
     DatabaseException
 )
+from app.core.cache import init_response_cache
+from app.core.timeutils import tick_clock
 from app.db.database import init_db
 from app.api.v1.auth import router as auth_router
 from app.api.v1.legacy_auth import router as legacy_auth_router
@@ -38,6 +43,9 @@ def create_application() -> FastAPI:
         version=settings.API_VERSION,
         debug=settings.DEBUG,
         description="AgentArena API for AI agent evaluation in custom playground environments",
+        # orjson serializes every response (UUIDs/datetimes natively),
+        # noticeably cheaper than stdlib json on the larger list payloads.
+        default_response_class=ORJSONResponse,
     )
 
     # Add CORS middleware
@@ -53,6 +61,11 @@ def create_application() -> FastAPI:
     # Add logging middleware
     app.add_middleware(LoggingMiddleware)
 
+    # Response cache for hot analytics endpoints (Redis when configured,
+    # in-process otherwise). Safe to init here: no connection is opened
+    # until the first cached request.
+    init_response_cache()
+
     # Exception handlers
     @app.exception_handler(NotFoundException)
     async def not_found_exception_handler(request: Request, exc: NotFoundException):
@@ -120,6 +133,25 @@ def create_application() -> FastAPI:
             }
         )
 
+    @app.exception_handler(Exception)
+    async def unhandled_exception_handler(request: Request, exc: Exception):
+        # Catch-all for anything the handlers above don't cover. Controllers
+        # no longer wrap their bodies in try/except Exception, so unexpected
+        # failures land here: logged once with a trace id, and the client
+        # gets an opaque 500 instead of the raw exception text.
+        trace_id = uuid.uuid4().hex
+        logger.exception(
+            f"Unhandled error {trace_id} on {request.method} {request.url.path}: {exc}"
+        )
+        return JSONResponse(
+            status_code=500,
+            content={
+                "error": "Internal Server Error",
+                "message": "An unexpected error occurred",
+                "trace_id": trace_id,
+            },
+        )
+
     # Include routers
     app.include_router(auth_router, prefix="/api/v1", tags=["Authentication"])
     app.include_router(legacy_auth_router, prefix="/api/v1")
@@ -132,6 +164,15 @@ def create_application() -> FastAPI:
     @app.on_event("startup")
     async def startup():
         try:
+            # One shared heartbeat task for every admin WebSocket
+            app.state.heartbeat_task = asyncio.create_task(admin.heartbeat_producer())
+            # Periodic precompute of the admin activity heatmap
+            app.state.heatmap_task = asyncio.create_task(admin.heatmap_rollup_refresher())
+            # Periodic daily_stats rollup backing the admin trend endpoints
+            app.state.daily_stats_task = asyncio.create_task(admin.daily_stats_refresher())
+            # Once-per-second timestamp cache read by hot status endpoints
+            app.state.clock_task = asyncio.create_task(tick_clock())
+
             # Initialize database without forcing recreation
             init_db(force_recreate=False)
             
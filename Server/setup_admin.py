@@ -40,6 +40,7 @@ def create_admin_account():
             firstName=admin_data["firstName"],
             lastName=admin_data["lastName"],
             role=UserRole.ADMIN,
+            isAdmin=True,
             isActive=True,
             isEmailVerified=True
         )
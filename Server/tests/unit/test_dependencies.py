@@ -0,0 +1,73 @@
+import time
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import dependencies
+from app.api.dependencies import AuthUser, get_admin_user, get_current_user
+from app.models.enums import UserRole
+
+
+class TestAuthDependencyCache:
+    """FastAPI caches dependency results per-request; these tests pin the
+    behavior so stacking get_admin_user on top of get_current_user never
+    re-decodes the token or re-fetches the user."""
+
+    @pytest.fixture
+    def probe_app(self, monkeypatch):
+        decode_calls = []
+        load_calls = []
+
+        def fake_decode(token):
+            decode_calls.append(token)
+            return {"sub": "11111111-2222-4333-8444-555555555555", "exp": time.time() + 60}
+
+        def fake_load(db, user_id):
+            load_calls.append(user_id)
+            return AuthUser(
+                id=user_id,
+                username="admin",
+                email="admin@example.com",
+                role=UserRole.ADMIN,
+                is_active=True,
+                is_admin=True,
+            )
+
+        monkeypatch.setattr(dependencies, "_decode_token", fake_decode)
+        monkeypatch.setattr(dependencies, "_load_user", fake_load)
+
+        app = FastAPI()
+
+        @app.get("/probe")
+        def probe(
+            user: AuthUser = Depends(get_current_user),
+            admin: AuthUser = Depends(get_admin_user),
+        ):
+            return {"id": user.id, "same_object": user is admin}
+
+        return app, decode_calls, load_calls
+
+    def test_stacked_dependencies_decode_token_exactly_once(self, probe_app):
+        app, decode_calls, load_calls = probe_app
+        client = TestClient(app)
+
+        response = client.get(
+            "/probe", headers={"Authorization": "Bearer aaa.bbb.ccc"}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["same_object"] is True
+        assert len(decode_calls) == 1
+        assert len(load_calls) == 1
+
+    def test_missing_credentials_rejected_before_decode(self, probe_app):
+        app, decode_calls, _ = probe_app
+        client = TestClient(app)
+
+        response = client.get("/probe")
+
+        # The security scheme rejects before the dependency runs, keeping
+        # the API's 401 contract for unauthenticated requests.
+        assert response.status_code == 401
+        assert decode_calls == []